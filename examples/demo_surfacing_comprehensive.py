@@ -5,77 +5,129 @@ This demonstrates the real-world benefits of automatic property surfacing.
 """
 
 import sys
+import textwrap
+from types import MappingProxyType
 
 sys.path.insert(0, ".")
 
 from rackfish import RedfishClient, RedfishResource
 
-
-# Mock Huawei BMC client
-class MockHuaweiBMC:
-    def __init__(self):
-        self.base_url = "https://huawei-bmc.example.com/redfish/v1"
-        self.responses = {
-            "/redfish/v1/Systems/1": {
-                "@odata.id": "/redfish/v1/Systems/1",
-                "Id": "1",
-                "Name": "System",
-                "PowerState": "On",
-                "BootSourceOverrideTarget": "Pxe",
-                "Links": {
-                    "Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}],
-                    "ManagedBy": [{"@odata.id": "/redfish/v1/Managers/1"}],
+# Canned BMC responses, built once at import and shared by every mock instance.
+# The top-level mapping is read-only; payloads stay plain dicts/lists because
+# RedfishResource maps JSON objects and arrays, not arbitrary mappings.
+_RESPONSES = MappingProxyType(
+    {
+        "/redfish/v1/Systems/1": {
+            "@odata.id": "/redfish/v1/Systems/1",
+            "Id": "1",
+            "Name": "System",
+            "PowerState": "On",
+            "BootSourceOverrideTarget": "Pxe",
+            "Links": {
+                "Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}],
+                "ManagedBy": [{"@odata.id": "/redfish/v1/Managers/1"}],
+            },
+            "Oem": {
+                "Huawei": {
+                    "BootMode": "UEFI",
+                    "ProductName": "TaiShan 2280 V2",
+                    "FruControl": {"@odata.id": "/redfish/v1/Systems/1/Oem/Huawei/FruControl"},
+                }
+            },
+            "Actions": {
+                "#ComputerSystem.Reset": {
+                    "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset",
+                    "ResetType@Redfish.AllowableValues": ["On", "ForceOff", "GracefulRestart"],
                 },
                 "Oem": {
                     "Huawei": {
-                        "BootMode": "UEFI",
-                        "ProductName": "TaiShan 2280 V2",
-                        "FruControl": {"@odata.id": "/redfish/v1/Systems/1/Oem/Huawei/FruControl"},
-                    }
-                },
-                "Actions": {
-                    "#ComputerSystem.Reset": {
-                        "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset",
-                        "ResetType@Redfish.AllowableValues": ["On", "ForceOff", "GracefulRestart"],
-                    },
-                    "Oem": {
-                        "Huawei": {
-                            "#HuaweiComputerSystem.FruControl": {
-                                "target": "/redfish/v1/Systems/1/Actions/Oem/Huawei/FruControl"
-                            }
+                        "#HuaweiComputerSystem.FruControl": {
+                            "target": "/redfish/v1/Systems/1/Actions/Oem/Huawei/FruControl"
                         }
-                    },
+                    }
                 },
             },
-            "/redfish/v1/Chassis/1": {
-                "@odata.id": "/redfish/v1/Chassis/1",
-                "Id": "1",
-                "Name": "Chassis",
-                "ChassisType": "RackMount",
-            },
-            "/redfish/v1/Managers/1": {
-                "@odata.id": "/redfish/v1/Managers/1",
-                "Id": "BMC",
-                "Name": "Manager",
-                "FirmwareVersion": "3.00",
-            },
-        }
+        },
+        "/redfish/v1/Chassis/1": {
+            "@odata.id": "/redfish/v1/Chassis/1",
+            "Id": "1",
+            "Name": "Chassis",
+            "ChassisType": "RackMount",
+        },
+        "/redfish/v1/Managers/1": {
+            "@odata.id": "/redfish/v1/Managers/1",
+            "Id": "BMC",
+            "Name": "Manager",
+            "FirmwareVersion": "3.00",
+        },
+    }
+)
+
+
+_EMPTY = MappingProxyType({})
+
+
+# Mock Huawei BMC client
+class MockHuaweiBMC:
+    def __init__(self):
+        self.base_url = "https://huawei-bmc.example.com/redfish/v1"
+        self.responses = _RESPONSES
 
     def get(self, path):
-        return self.responses.get(path, {})
+        return self.responses.get(path, _EMPTY)
 
     def post(self, path, data=None):
         print(f"POST {path} with data: {data}")
         return {}
 
 
+# Stateless over the shared _RESPONSES, so one instance serves every demo
+_MOCK_BMC = MockHuaweiBMC()
+
+
+_BAR = "=" * 70
+
+# Static closing summary, emitted with a single write
+_SUMMARY = (
+    f"\n{_BAR}\nSUMMARY OF BENEFITS\n{_BAR}\n"
+    + textwrap.dedent(
+        """
+        ✅ Cleaner Code
+           Before: system.Oem['Huawei']['BootMode']
+           After:  system.BootMode
+
+        ✅ Better IDE Support
+           - Autocomplete works on surfaced properties
+           - Type hints are preserved
+
+        ✅ Easier Discovery
+           - dir(system) shows all available properties
+           - No need to dig into Oem/Links dicts
+
+        ✅ More Pythonic
+           - Dot notation instead of dict access
+           - Natural traversal: system.Chassis[0].Thermal.Fans
+
+        ✅ Safe
+           - Standard properties never overwritten
+           - Collision detection prevents conflicts
+
+        ✅ Backward Compatible
+           - Oem and Links dicts still accessible
+           - Existing code continues to work
+        """
+    )
+    + f"\n{_BAR}\n"
+)
+
+
 def demo_old_way():
     """Show the old way of accessing OEM and Links (before surfacing)."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("OLD WAY: Manual nested access (before surfacing)")
-    print("=" * 70)
+    print(_BAR)
 
-    mock_client = MockHuaweiBMC()
+    mock_client = _MOCK_BMC
     system = RedfishResource(mock_client, path="/redfish/v1/Systems/1", data=None, fetched=False)
 
     print("\n1. Accessing standard properties:")
@@ -99,11 +151,11 @@ def demo_old_way():
 
 def demo_new_way():
     """Show the new way with automatic surfacing."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("NEW WAY: Direct access with automatic surfacing")
-    print("=" * 70)
+    print(_BAR)
 
-    mock_client = MockHuaweiBMC()
+    mock_client = _MOCK_BMC
     system = RedfishResource(mock_client, path="/redfish/v1/Systems/1", data=None, fetched=False)
 
     print("\n1. Standard properties (same as before):")
@@ -134,11 +186,11 @@ def demo_new_way():
 
 def demo_backward_compatibility():
     """Show that old access methods still work."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("BACKWARD COMPATIBILITY: Old methods still work")
-    print("=" * 70)
+    print(_BAR)
 
-    mock_client = MockHuaweiBMC()
+    mock_client = _MOCK_BMC
     system = RedfishResource(mock_client, path="/redfish/v1/Systems/1", data=None, fetched=False)
 
     print("\n✓ Original Oem dict still accessible:")
@@ -162,9 +214,9 @@ def demo_backward_compatibility():
 
 def demo_collision_safety():
     """Show collision safety - standard properties not overwritten."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("COLLISION SAFETY: Standard properties protected")
-    print("=" * 70)
+    print(_BAR)
 
     # Create mock data with potential collision
     mock_client = MockHuaweiBMC()
@@ -196,45 +248,14 @@ def demo_collision_safety():
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("COMPREHENSIVE OEM AND LINKS SURFACING DEMO")
     print("Simulating Huawei BMC with vendor extensions")
-    print("=" * 70)
+    print(_BAR)
 
     demo_old_way()
     demo_new_way()
     demo_backward_compatibility()
     demo_collision_safety()
 
-    print("\n" + "=" * 70)
-    print("SUMMARY OF BENEFITS")
-    print("=" * 70)
-    print(
-        """
-✅ Cleaner Code
-   Before: system.Oem['Huawei']['BootMode']
-   After:  system.BootMode
-
-✅ Better IDE Support
-   - Autocomplete works on surfaced properties
-   - Type hints are preserved
-
-✅ Easier Discovery
-   - dir(system) shows all available properties
-   - No need to dig into Oem/Links dicts
-
-✅ More Pythonic
-   - Dot notation instead of dict access
-   - Natural traversal: system.Chassis[0].Thermal.Fans
-
-✅ Safe
-   - Standard properties never overwritten
-   - Collision detection prevents conflicts
-
-✅ Backward Compatible
-   - Oem and Links dicts still accessible
-   - Existing code continues to work
-    """
-    )
-
-    print("=" * 70)
+    sys.stdout.write(_SUMMARY)
@@ -4,6 +4,8 @@ Comprehensive examples demonstrating common Redfish use cases with pyredfisher.
 This file shows real-world patterns for managing servers, storage, network, users, and more.
 """
 
+from itertools import islice
+
 from rackfish import RedfishClient
 
 # ============================================================================
@@ -50,10 +52,10 @@ def manage_users(client):
     new_user.RoleId = "Administrator"
     print(f"Updated role for {new_user.UserName} to Administrator")
 
-    # List all users
-    print("Current users:")
-    for user in accounts:
-        print(f"  - {user.UserName} ({user.RoleId})")
+    # List all users (buffered: one write instead of one per account)
+    lines = ["Current users:"]
+    lines.extend(f"  - {user.UserName} ({user.RoleId})" for user in accounts)
+    print("\n".join(lines))
 
     # Delete user
     new_user.delete()
@@ -69,7 +71,8 @@ def control_system_power(client):
     """Demonstrate system power operations."""
     print("\n=== System Power Control ===")
 
-    for system in client.Systems:
+    # Fetch all systems concurrently; members come back in collection order
+    for system in client.Systems.prefetch():
         print(f"System: {system.Name}")
         print(f"  Current Power State: {system.PowerState}")
 
@@ -83,7 +86,7 @@ def control_system_power(client):
         # print(f"  Initiated GracefulRestart")
 
         # OEM power control (if available)
-        if hasattr(system, "FruControl"):
+        if "FruControl" in system:
             print(f"  OEM FruControl action available")
             # system.FruControl(Operation="PowerCycle")
 
@@ -102,15 +105,15 @@ def configure_bios(client):
 
     print(f"Current BIOS attributes:")
     bios_attrs = bios.Attributes
-    for key in list(bios_attrs.keys())[:5]:  # Show first 5
-        print(f"  {key}: {bios_attrs[key]}")
+    for key, value in islice(bios_attrs.items(), 5):  # Show first 5
+        print(f"  {key}: {value}")
 
     # Update BIOS settings
     # bios.patch({"Attributes": {"BootMode": "UEFI"}})
     # print("Updated BootMode to UEFI")
 
     # Reset BIOS to defaults (if action available)
-    if hasattr(bios, "ResetBios"):
+    if "ResetBios" in bios:
         # bios.ResetBios()
         print("ResetBios action available")
 
@@ -134,10 +137,10 @@ def manage_storage(client):
             print(f"  Drive: {drive.Name}")
             print(f"    Capacity: {drive.CapacityBytes / (1024**3):.2f} GB")
             print(f"    Media Type: {drive.MediaType}")
-            print(f"    Status: {drive.Status['Health']}")
+            print(f"    Status: {drive.Status.Health}")
 
         # List volumes (logical drives)
-        if hasattr(storage, "Volumes"):
+        if "Volumes" in storage:
             print(f"  Volumes:")
             for vol in storage.Volumes:
                 print(f"    - {vol.Name}: {vol.CapacityBytes / (1024**3):.2f} GB")
@@ -169,7 +172,7 @@ def configure_network(client):
         print(f"  Speed: {eth.SpeedMbps} Mbps")
 
         # IPv4 configuration
-        if hasattr(eth, "IPv4Addresses"):
+        if "IPv4Addresses" in eth:
             for ipv4 in eth.IPv4Addresses:
                 print(f"  IPv4: {ipv4.get('Address')} / {ipv4.get('SubnetMask')}")
 
@@ -186,9 +189,9 @@ def configure_network(client):
     net_proto = manager.NetworkProtocol
     print(f"\nNetwork Protocols:")
 
-    if hasattr(net_proto, "NTP"):
+    if "NTP" in net_proto:
         ntp = net_proto.NTP
-        if hasattr(ntp, "NTPServers"):
+        if "NTPServers" in ntp:
             print(f"  NTP Servers: {ntp.NTPServers}")
 
     # Update NTP servers
@@ -207,7 +210,7 @@ def configure_vlan(client):
     manager = next(iter(client.Managers))
     eth = manager.EthernetInterfaces[0]
 
-    if hasattr(eth, "VLANs"):
+    if "VLANs" in eth:
         vlans = eth.VLANs
 
         # List existing VLANs
@@ -251,11 +254,10 @@ def manage_event_subscriptions(client):
     # })
     # print(f"Created subscription: {new_sub.Id}")
 
-    # Delete subscription
-    # for sub in subs:
-    #     if sub.Destination == "https://my.listener.com/events":
-    #         sub.delete()
-    #         print(f"Deleted subscription {sub.Id}")
+    # Delete subscription (server-side $filter where supported; matches are re-checked locally)
+    # for sub in subs.filter(Destination="https://my.listener.com/events"):
+    #     sub.delete()
+    #     print(f"Deleted subscription {sub.Id}")
 
 
 # ============================================================================
@@ -270,9 +272,9 @@ def manage_certificates(client):
     manager = next(iter(client.Managers))
 
     # HTTPS certificates
-    if hasattr(manager.NetworkProtocol, "HTTPS"):
+    if "HTTPS" in manager.NetworkProtocol:
         https = manager.NetworkProtocol.HTTPS
-        if hasattr(https, "Certificates"):
+        if "Certificates" in https:
             print("HTTPS Certificates:")
             for cert in https.Certificates:
                 print(f"  Subject: {cert.Subject}")
@@ -308,7 +310,7 @@ def update_firmware(client):
     print(f"  HTTP Push URI Supported: {update_service.HttpPushUriTargets}")
 
     # Get current firmware inventory
-    if hasattr(update_service, "FirmwareInventory"):
+    if "FirmwareInventory" in update_service:
         print("\nCurrent Firmware:")
         for fw in update_service.FirmwareInventory:
             print(f"  {fw.Name}: {fw.Version}")
@@ -331,6 +333,15 @@ def update_firmware(client):
 # ============================================================================
 
 
+# (subtree, collection, heading, line formatter) for each sensor section of a chassis
+_HEALTH_SECTIONS = (
+    ("Thermal", "Temperatures", "Temperatures", lambda t: f"{t.Name}: {t.ReadingCelsius}°C"),
+    ("Thermal", "Fans", "Fans", lambda f: f"{f.Name}: {f.Reading} RPM"),
+    ("Power", "Voltages", "Voltages", lambda v: f"{v.Name}: {v.ReadingVolts}V"),
+    ("Power", "PowerSupplies", "Power Supplies", lambda p: f"{p.Name}: {p.Status.Health}"),
+)
+
+
 def monitor_system_health(client):
     """Demonstrate health and sensor monitoring."""
     print("\n=== System Health Monitoring ===")
@@ -339,40 +350,23 @@ def monitor_system_health(client):
 
     # Overall system health
     print(f"System: {system.Name}")
-    print(f"  Health: {system.Status['Health']}")
-    print(f"  State: {system.Status['State']}")
+    print(f"  Health: {system.Status.Health}")
+    print(f"  State: {system.Status.State}")
 
-    # Chassis and sensors
+    # Chassis and sensors; each chassis report is buffered and written once,
+    # so hundreds of sensors don't mean hundreds of writes to the terminal
     for chassis in system.Chassis:
-        print(f"\nChassis: {chassis.Name}")
-
-        # Temperature sensors
-        if hasattr(chassis, "Thermal"):
-            thermal = chassis.Thermal
-            if hasattr(thermal, "Temperatures"):
-                print("  Temperatures:")
-                for temp in thermal.Temperatures:
-                    print(f"    {temp.Name}: {temp.ReadingCelsius}°C")
-
-            # Fans
-            if hasattr(thermal, "Fans"):
-                print("  Fans:")
-                for fan in thermal.Fans:
-                    print(f"    {fan.Name}: {fan.Reading} RPM")
-
-        # Power and voltages
-        if hasattr(chassis, "Power"):
-            power = chassis.Power
-            if hasattr(power, "Voltages"):
-                print("  Voltages:")
-                for volt in power.Voltages:
-                    print(f"    {volt.Name}: {volt.ReadingVolts}V")
-
-            # Power supplies
-            if hasattr(power, "PowerSupplies"):
-                print("  Power Supplies:")
-                for ps in power.PowerSupplies:
-                    print(f"    {ps.Name}: {ps.Status['Health']}")
+        lines = [f"\nChassis: {chassis.Name}"]
+        for subtree_name, collection, heading, describe in _HEALTH_SECTIONS:
+            # `in` answers from the capability set; no AttributeError on a miss
+            if subtree_name not in chassis:
+                continue
+            subtree = getattr(chassis, subtree_name)
+            if collection in subtree:
+                lines.append(f"  {heading}:")
+                lines.extend(f"    {describe(item)}" for item in getattr(subtree, collection))
+
+        print("\n".join(lines))
 
 
 # ============================================================================
@@ -392,13 +386,15 @@ def collect_system_logs(client):
         print(f"  Overflow Policy: {log_service.OverWritePolicy}")
 
         # Get recent entries
-        if hasattr(log_service, "Entries"):
-            print("  Recent Entries:")
-            for entry in list(log_service.Entries)[:5]:  # Last 5 entries
-                print(f"    [{entry.Created}] {entry.Severity}: {entry.Message}")
+        if "Entries" in log_service:
+            lines = ["  Recent Entries:"]
+            # islice stops after 5 members, so later pages are never requested
+            for entry in islice(log_service.Entries, 5):
+                lines.append(f"    [{entry.Created}] {entry.Severity}: {entry.Message}")
+            print("\n".join(lines))
 
         # Clear log (if action available)
-        if hasattr(log_service, "ClearLog"):
+        if "ClearLog" in log_service:
             # log_service.ClearLog()
             print("  ClearLog action available")
 
@@ -446,7 +442,7 @@ def manage_virtual_media(client):
 
     manager = next(iter(client.Managers))
 
-    if hasattr(manager, "VirtualMedia"):
+    if "VirtualMedia" in manager:
         for media in manager.VirtualMedia:
             print(f"Media: {media.Name}")
             print(f"  Media Type: {media.MediaTypes}")
@@ -455,7 +451,7 @@ def manage_virtual_media(client):
                 print(f"  Image: {media.Image}")
 
             # Insert ISO image
-            # if hasattr(media, "InsertMedia"):
+            # if "InsertMedia" in media:
             #     media.InsertMedia(
             #         Image="http://fileserver.local/isos/ubuntu-22.04.iso",
             #         Inserted=True
@@ -463,7 +459,7 @@ def manage_virtual_media(client):
             #     print(f"Inserted ISO into {media.Name}")
 
             # Eject media
-            # if hasattr(media, "EjectMedia"):
+            # if "EjectMedia" in media:
             #     media.EjectMedia()
             #     print(f"Ejected media from {media.Name}")
 
@@ -479,12 +475,12 @@ def configure_ldap(client):
 
     acct_service = client.AccountService
 
-    if hasattr(acct_service, "LDAP"):
+    if "LDAP" in acct_service:
         ldap = acct_service.LDAP
 
         print(f"LDAP Configuration:")
         print(f"  Enabled: {ldap.ServiceEnabled}")
-        if hasattr(ldap, "ServiceAddresses"):
+        if "ServiceAddresses" in ldap:
             print(f"  Servers: {ldap.ServiceAddresses}")
 
         # Update LDAP settings
@@ -499,7 +495,7 @@ def configure_ldap(client):
         # })
 
         # Configure LDAP role mapping
-        if hasattr(ldap, "RemoteRoleMapping"):
+        if "RemoteRoleMapping" in ldap:
             print("  LDAP Role Mappings:")
             for mapping in ldap.RemoteRoleMapping:
                 print(f"    {mapping.RemoteGroup} -> {mapping.LocalRole}")
@@ -17,6 +17,7 @@ For more examples, see the documentation at:
 https://github.com/thefrolov/rackfish
 """
 
+from .async_client import AsyncRedfishClient
 from .client import RedfishClient, RedfishError, RedfishResource
 
 __version__ = "1.0.3"
@@ -24,4 +25,4 @@ __author__ = "Dmitrii Frolov"
 __email__ = "thefrolov@mts.ru"
 __license__ = "MIT"
 
-__all__ = ["RedfishClient", "RedfishError", "RedfishResource"]
+__all__ = ["AsyncRedfishClient", "RedfishClient", "RedfishError", "RedfishResource"]
@@ -0,0 +1,206 @@
+"""
+Asynchronous Redfish client built on httpx (optional dependency).
+
+Install with ``pip install rackfish[async]`` (or ``rackfish[http2]`` to also
+multiplex requests over a single HTTP/2 connection). Independent requests can be
+overlapped with ``asyncio.gather`` instead of paying one round-trip each:
+
+    async with AsyncRedfishClient("https://bmc", "admin", "secret") as client:
+        systems = await client.gather_members("/redfish/v1/Systems")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import Any, cast
+
+from .client import (
+    _DEFAULT_HEADERS,
+    HTTP_OK,
+    RedfishError,
+    RedfishResource,
+    _host_base,
+    _json_loads,
+    _safe_join,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+# h2 is never imported here; its presence enables HTTP/2 support in httpx
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+# httpx advertises the encodings it can decode itself
+_HEADERS = {k: v for k, v in _DEFAULT_HEADERS.items() if k != "Accept-Encoding"}
+
+
+class AsyncRedfishClient:
+    """
+    Async counterpart of RedfishClient for fan-out reads.
+    Resources it returns are detached snapshots: their JSON and surfaced OEM/Links
+    children are available, but link stubs inside them are not followed (use
+    ``await client.resource(path)`` for the next hop) and calling an action raises
+    RedfishError (use ``await client.post(target, data)`` instead).
+    transport: custom httpx transport (e.g. httpx.MockTransport in tests)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str | None = None,
+        password: str | None = None,
+        *,
+        use_session: bool = True,
+        verify_ssl: bool = True,
+        timeout: float = 30,
+        default_headers: dict[str, str] | None = None,
+        max_connections: int = 32,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        if httpx is None:
+            raise ImportError("AsyncRedfishClient requires httpx: pip install rackfish[async]")
+
+        self.base_url = _host_base(base_url)
+        self._sessions_url = self.base_url + "/redfish/v1/SessionService/Sessions"
+        self.username = username
+        self.password = password
+        self.use_session_auth = use_session
+
+        auth = (username, password) if username and password and not use_session else None
+        # HTTP/2 multiplexes concurrent requests over one TLS connection; use it
+        # whenever h2 is installed unless told otherwise (BMCs without HTTP/2
+        # simply negotiate HTTP/1.1)
+        self._http = httpx.AsyncClient(
+            http2=_HAS_H2 if http2 is None else http2,
+            verify=verify_ssl,
+            timeout=timeout,
+            auth=auth,
+            headers={**_HEADERS, **(default_headers or {})},
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            transport=transport,
+        )
+        self._session_token: str | None = None
+        self._session_uri: str | None = None
+
+    async def __aenter__(self) -> AsyncRedfishClient:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        await self.logout()
+
+    # ---- auth ----
+
+    async def login(self) -> None:
+        if not (self.username and self.password):
+            raise RedfishError("Username/password required for session login")
+
+        resp = await self._http.post(
+            self._sessions_url, json={"UserName": self.username, "Password": self.password}
+        )
+        if resp.status_code not in (200, 201):
+            raise RedfishError(f"Login failed: {resp.status_code} {resp.text}")
+
+        token = resp.headers.get("X-Auth-Token")
+        loc = resp.headers.get("Location")
+        if token:
+            self._http.headers["X-Auth-Token"] = token
+            self._session_token = token
+        if loc:
+            self._session_uri = _safe_join(self.base_url, loc)
+
+    async def logout(self) -> None:
+        try:
+            if self._session_uri and self._session_token:
+                await self.delete(self._session_uri)
+        finally:
+            await self._http.aclose()
+            self._session_token = None
+            self._session_uri = None
+
+    async def connect(self) -> RedfishResource:
+        if self.use_session_auth and self.username and self.password and not self._session_token:
+            await self.login()
+        return await self.resource("/redfish/v1")
+
+    # ---- HTTP verbs ----
+
+    async def get(self, path: str) -> dict[str, Any]:
+        url = _safe_join(self.base_url, path)
+        resp = await self._http.get(url)
+        if resp.status_code != HTTP_OK:
+            raise RedfishError(
+                f"GET {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
+        if not resp.content:
+            return {}
+        try:
+            return cast("dict[str, Any]", _json_loads(resp.content))
+        except Exception:
+            raise RedfishError(f"GET {url} returned non-JSON") from None
+
+    async def post(self, path: str, data: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        url = _safe_join(self.base_url, path)
+        resp = await self._http.post(url, json=data or {})
+        if resp.status_code not in (200, 201, 202, 204):
+            raise RedfishError(
+                f"POST {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
+        if resp.status_code in (200, 201) and resp.content:
+            try:
+                return cast("dict[str, Any]", _json_loads(resp.content))
+            except Exception:
+                return None
+        return None
+
+    async def patch(self, path: str, data: dict[str, Any], etag: str | None = None) -> None:
+        url = _safe_join(self.base_url, path)
+        headers = {"If-Match": etag} if etag else {}
+        resp = await self._http.patch(url, json=data, headers=headers)
+        if resp.status_code not in (200, 204):
+            raise RedfishError(
+                f"PATCH {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
+
+    async def delete(self, path: str) -> None:
+        url = _safe_join(self.base_url, path)
+        resp = await self._http.delete(url)
+        if resp.status_code not in (200, 204):
+            raise RedfishError(
+                f"DELETE {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
+
+    # ---- navigation ----
+
+    async def resource(self, path: str) -> RedfishResource:
+        """GET path and wrap the payload in a (detached) RedfishResource."""
+        data = await self.get(path)
+        path = data.get("@odata.id", path)
+        return RedfishResource(None, path=path, data=data, fetched=True)  # type: ignore[arg-type]
+
+    async def gather(self, paths: list[str]) -> list[dict[str, Any]]:
+        """GET all paths concurrently; results keep the order of paths."""
+        return list(await asyncio.gather(*(self.get(p) for p in paths)))
+
+    async def gather_members(self, collection: str | RedfishResource) -> list[RedfishResource]:
+        """Fetch a collection (following nextLink pages) and all its members concurrently."""
+        page = await self.get(collection) if isinstance(collection, str) else collection.to_dict()
+        member_paths: list[str] = []
+        while True:
+            member_paths.extend(
+                m["@odata.id"]
+                for m in page.get("Members", [])
+                if isinstance(m, dict) and "@odata.id" in m
+            )
+            next_link = page.get("Members@odata.nextLink")
+            if not next_link:
+                break
+            page = await self.get(next_link)
+        return list(await asyncio.gather(*(self.resource(p) for p in member_paths)))
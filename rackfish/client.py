@@ -1,52 +1,314 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
-import re
+import os
+import ssl
+import sys
 import threading
-from typing import Any, ClassVar, Iterable
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Iterable, Iterator
+from urllib.parse import quote, unquote
+from weakref import WeakValueDictionary
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:  # optional: several times faster on the large documents BMCs return
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: constant-memory parsing of very large collections
+    import ijson
+except ImportError:
+    ijson = None
 
 # HTTP status codes
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+
+# Sentinel for dict lookups where None is a legitimate value
+_MISSING = object()
+
+_ALLOWABLE_SUFFIX = "@Redfish.AllowableValues"
+
+# Structural properties read from the raw JSON by dedicated code (iteration,
+# surfacing, actions). Their attribute form is only built if it is accessed.
+_DEFERRED_KEYS = frozenset({"Members", "Links", "Oem", "Actions"})
+
+# Statuses with which a service rejects a query option it does not support
+# ($filter, $expand), as opposed to failing the request for some other reason
+_QUERY_REJECTED = frozenset({400, 405, 501})
+
+# Prefixes of paths that are already absolute URLs (one C-level startswith)
+_ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+
+# Connection pool for the single BMC host: enough keep-alive sockets for
+# concurrent member fetches (see RedfishResource.prefetch); default of pool_maxsize
+_POOL_MAXSIZE = 32
+# Throttling and transient gateway/overload errors are retried with backoff
+# (honouring Retry-After). POST is left out: actions such as Reset are not idempotent.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "PATCH", "DELETE"}),
+    raise_on_status=False,
+)
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+# Pre-encoded body for parameterless POSTs (most action invocations)
+_EMPTY_JSON = b"{}"
+
+# Sent with every request unless overridden by default_headers. Compressed
+# bodies are decoded transparently: urllib3 offers gzip/deflate plus br and zstd
+# when brotli/zstandard are installed. OData-Version is the header Redfish
+# clients are expected to send (DSP0266).
+_DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "OData-Version": "4.0",
+}
 
 # ---------------------------
 # Utilities
 # ---------------------------
 
 
+def _json_loads(content: bytes) -> Any:
+    """Parse a UTF-8 JSON body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _copy_json(value: Any) -> Any:
+    """
+    Deep-copy parsed JSON. Only dicts and lists need copying (everything else
+    is an immutable scalar), so this skips copy.deepcopy's memo bookkeeping.
+    """
+    kind = type(value)
+    if kind is dict:
+        return {k: _copy_json(v) for k, v in value.items()}
+    if kind is list:
+        return [_copy_json(v) for v in value]
+    return value
+
+
 def _is_identifier(key: str) -> bool:
-    """Return True if key is a valid Python identifier (attr-safe)."""
-    return re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", key) is not None
-
-
-def _dtype_matches(value: Any, dtype: str) -> bool:
-    """Basic datatype check against Redfish ActionInfo DataType values."""
-    # Common DataType values in Redfish ActionInfo:
-    # "String", "Integer", "Number", "Boolean", "Array", "Object"
-    m = {
-        "String": lambda v: isinstance(v, str),
-        "Integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
-        "Number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-        "Boolean": lambda v: isinstance(v, bool),
-        "Array": lambda v: isinstance(v, list),
-        "Object": lambda v: isinstance(v, dict),
-        # Some implementations use "Password", "Enumeration"—treat like string
-        # unless AllowableValues present
-        "Password": lambda v: isinstance(v, str),
-        "Enumeration": lambda _v: True,  # validated via AllowableValues if present
-        # Fallback: accept anything
-    }
-    fn = m.get(dtype, lambda _v: True)
-    return fn(value)
+    """Return True if key is a valid ASCII Python identifier (attr-safe)."""
+    return key.isascii() and key.isidentifier()
+
+
+# Common DataType values in Redfish ActionInfo:
+# "String", "Integer", "Number", "Boolean", "Array", "Object"
+# DataType -> accepted Python types, for a single isinstance() call
+_DTYPE_TYPES: dict[str, tuple[type, ...]] = {
+    "String": (str,),
+    "Integer": (int,),
+    "Number": (int, float),
+    "Boolean": (bool,),
+    "Array": (list,),
+    "Object": (dict,),
+    # Some implementations use "Password"; treat like string. "Enumeration" and
+    # any other DataType accept anything (AllowableValues still apply)
+    "Password": (str,),
+}
+# bool is an int subclass, but True is not a valid Integer/Number argument
+_DTYPE_NOT_BOOL = frozenset({"Integer", "Number"})
+
+
+def _allowed_set(allow: list[Any]) -> frozenset[Any] | None:
+    """AllowableValues as a frozenset for O(1) membership, or None if unhashable."""
+    try:
+        return frozenset(allow)
+    except TypeError:
+        return None
+
+
+def _id_from_path(path: str) -> str:
+    """Return the Id of a collection member from its URI (last path segment)."""
+    return unquote(path.rstrip("/").rsplit("/", 1)[-1])
+
+
+def _host_base(base_url: str) -> str:
+    """Strip a trailing slash and any /redfish[/v1] suffix from a service URL."""
+    base = base_url.rstrip("/")
+    for suffix in ("/redfish/v1", "/redfish"):
+        if base.endswith(suffix):
+            return base[: -len(suffix)]
+    return base
 
 
 def _safe_join(base: str, path: str) -> str:
-    if path.startswith("http"):
+    """Resolve path against base, which must have no trailing slash (see _host_base)."""
+    if path.startswith(_ABSOLUTE_URL_PREFIXES):
         return path
-    return base.rstrip("/") + "/" + path.lstrip("/")
+    return base + "/" + path.lstrip("/")
+
+
+def _surfacing_candidates(obj: dict[str, Any]) -> Iterable[tuple[str, Any]]:
+    """Yield (key, value) for every OEM vendor child, then every Links child."""
+    oem = obj.get("Oem")
+    if isinstance(oem, dict):
+        for vendor_data in oem.values():
+            if isinstance(vendor_data, dict):
+                yield from vendor_data.items()
+    links = obj.get("Links")
+    if isinstance(links, dict):
+        yield from links.items()
+
+
+def _odata_literal(value: Any) -> str:
+    """Render a Python value as an OData $filter literal."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _action_entry(key: str, info: dict[str, Any]) -> tuple[str, str | None, str | None]:
+    """(clean name, target, ActionInfo URI) for one "#Schema.Action" entry."""
+    clean_name = key.lstrip("#").split(".")[-1]  # e.g., "Reset"
+    return clean_name, info.get("target"), info.get("@Redfish.ActionInfo")
+
+
+def _action_entries(actions: dict[str, Any]) -> Iterable[tuple[str, str | None, str | None]]:
+    for key, info in actions.items():
+        if key.startswith("#") and isinstance(info, dict):
+            yield _action_entry(key, info)
+
+
+def _make_action(clean_name: str, has_action_info: bool):
+    def _action_method(this: RedfishResource, **kwargs):
+        # Targets (and ActionInfo URIs) embed the member path, so they are
+        # looked up on the resource rather than baked into the shared function
+        target, action_info_uri = this._action_targets[clean_name]
+        if not target:
+            raise RedfishError(f"Action '{clean_name}' has no target")
+        if this._client is None:
+            raise RedfishError(
+                f"Resource {this._path} is not attached to a client; cannot call {clean_name}"
+            )
+        if has_action_info and action_info_uri:
+            validator = this._action_validator(action_info_uri)
+            if validator:
+                validator(kwargs)
+        # POST to action target with kwargs (or {} if none)
+        return this._client.post(target, data=kwargs)
+
+    # Attach __name__ for nicer repr; the bound action adds the signature hint
+    # to its doc once the resource's ActionInfo has been loaded
+    _action_method.__name__ = clean_name
+    _action_method.__qualname__ = f"RedfishResource.{clean_name}"
+    _action_method.__doc__ = f"Dynamic Redfish action {clean_name}"
+    return _action_method
+
+
+@lru_cache(maxsize=256)
+def _action_table(
+    signature: tuple[tuple[str, bool], ...],
+) -> MappingProxyType[str, Callable[..., Any]]:
+    """
+    Action functions for one Actions shape, i.e. (name, has ActionInfo) pairs,
+    shared by every resource with that shape (e.g. all members of a collection).
+    Functions hold no per-resource state; they are bound to the resource on
+    attribute access and read its targets from _action_targets.
+    """
+    return MappingProxyType({name: _make_action(name, info) for name, info in signature})
+
+
+class _BoundAction:
+    # An action function bound to one resource, like a bound method, but with a
+    # __doc__ carrying that resource's ActionInfo hint: the function itself is
+    # shared by every resource with the same Actions shape
+
+    __slots__ = ("__func__", "__self__", "__weakref__")
+
+    def __init__(self, func: Callable[..., Any], resource: RedfishResource):
+        self.__func__ = func
+        self.__self__ = resource
+
+    def __call__(self, **kwargs: Any) -> Any:
+        return self.__func__(self.__self__, **kwargs)
+
+    @property
+    def __name__(self) -> str:
+        return self.__func__.__name__
+
+    @property
+    def __doc__(self) -> str | None:  # type: ignore[override]
+        hint = self.__self__._action_hint(self.__func__.__name__)
+        doc = self.__func__.__doc__
+        return f"{doc} | params: {hint}" if hint is not None else doc
+
+    # Equal when bound to the same resource, like bound methods, so
+    # system.Reset == system.Reset holds even after the weak cache let go
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _BoundAction):
+            return NotImplemented
+        return self.__func__ is other.__func__ and self.__self__ is other.__self__
+
+    def __hash__(self) -> int:
+        return hash((self.__func__, id(self.__self__)))
+
+    def __repr__(self) -> str:
+        return f"<bound action {self.__func__.__name__} of {self.__self__!r}>"
+
+
+_NO_ACTIONS: MappingProxyType[str, Callable[..., Any]] = MappingProxyType({})
+
+
+@lru_cache(maxsize=None)
+def _insecure_ssl_context() -> ssl.SSLContext:
+    """
+    One SSLContext for every verify_ssl=False client. Without it urllib3 builds
+    a fresh context for each new connection (requests only pre-builds one for
+    verified connections).
+    """
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+@lru_cache(maxsize=None)
+def _class_names(cls: type) -> frozenset[str]:
+    """Everything defined on cls or its bases, computed once per class."""
+    return frozenset(dir(cls))
+
+
+@lru_cache(maxsize=None)
+def _reserved_names(cls: type) -> frozenset[str]:
+    """
+    Names surfaced children must not shadow: everything defined on cls or its
+    bases, and the structural properties whose attributes are built lazily.
+    """
+    return _class_names(cls) | _DEFERRED_KEYS
+
+
+def _fetch_member(member: RedfishResource) -> RedfishResource:
+    member._ensure_fetched()
+    return member
 
 
 # ---------------------------
@@ -55,13 +317,46 @@ def _safe_join(base: str, path: str) -> str:
 
 
 class RedfishError(Exception):
-    pass
+    """
+    Raised for failed requests and invalid operations. status_code is the HTTP
+    status of the failed response, or None when no response was involved.
+    """
+
+    def __init__(self, message: str = "", status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _PoolAdapter(HTTPAdapter):
+    """
+    HTTPAdapter for one BMC. With verify=False, certificates are never checked
+    (requests otherwise lets REQUESTS_CA_BUNDLE override Session.verify=False)
+    and all pools share one SSLContext.
+    """
+
+    __attrs__: ClassVar[list[str]] = [*HTTPAdapter.__attrs__, "_verify"]
+
+    def __init__(self, verify: bool = True, **kwargs: Any):
+        self._verify = verify
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if not self._verify:
+            kwargs["ssl_context"] = _insecure_ssl_context()
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if not self._verify:
+            kwargs["verify"] = False
+        return super().send(request, **kwargs)
 
 
 class RedfishClient:
     """
     Redfish HTTP client with session/basic auth and convenience verbs.
     base_url: e.g. "https://bmc.example.com" (with or without /redfish[/v1])
+    pool_maxsize: keep-alive connections held to the BMC; raise it together with
+    the max_workers of prefetch()/map() for wider fan-out
     """
 
     def __init__(
@@ -73,30 +368,71 @@ class RedfishClient:
         verify_ssl: bool = True,
         timeout: int = 30,
         default_headers: dict[str, str] | None = None,
+        *,
+        cache_size: int = 256,
+        cache_ttl: float = 2.0,
+        cache_dir: str | os.PathLike[str] | None = None,
+        pool_maxsize: int = _POOL_MAXSIZE,
     ):
-        base = base_url.rstrip("/")
-
-        self.base_url = base
+        self.base_url = _host_base(base_url)
         self.username = username
         self.password = password
         self.use_session_auth = use_session
         self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        # Fixed endpoints, joined once
+        self._root_url = self.base_url + "/redfish/v1"
+        self._sessions_url = self.base_url + "/redfish/v1/SessionService/Sessions"
 
         self._http = requests.Session()
         self._http.verify = verify_ssl
+        # Every request goes to one host, so a single pool sized for fan-out
+        adapter = _PoolAdapter(
+            verify=verify_ssl,
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=_RETRY,
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
 
         # Suppress SSL warnings when verify_ssl is disabled
         if not verify_ssl:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        self._http.headers.update(default_headers or {"Accept": "application/json"})
+        self._http.headers.update(_DEFAULT_HEADERS)
+        self._http.headers.update(default_headers or {})
         if username and password and not use_session:
             self._http.auth = (username, password)
 
         self._session_token: str | None = None
         self._session_uri: str | None = None
         self._root: RedfishResource | None = None
-        self._lock = threading.RLock()
+        # Attributes already resolved through the root (client.Systems, ...)
+        self._root_attr_cache: dict[str, Any] = {}
+        # Guards the in-memory caches; never held across a request
+        self._lock = threading.Lock()
+        # Serializes login + service root fetch so concurrent first uses log in once
+        self._connect_lock = threading.Lock()
+        # Compiled ActionInfo shared by all resources: uri -> (schema, validator, hint)
+        self._action_info: dict[str, tuple[Any, Any, str | None]] = {}
+        # Whether the service accepts $filter / $expand queries; learned on first use
+        self._supports_filter: bool | None = None
+        self._supports_expand: bool | None = None
+
+        # LRU of GET responses: url -> (stored_at, etag, body). Within cache_ttl
+        # seconds an entry is served without a request; after that, entries with
+        # an ETag are revalidated with If-None-Match, so a hit costs a 304.
+        self._cache: OrderedDict[str, tuple[float, str | None, dict[str, Any]]] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+
+        # Optional on-disk copy of the same entries, so ETag revalidation
+        # carries across processes (one JSON file per URL). Bodies can hold
+        # sensitive BMC data, so the directory and files are private to the user
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir is not None else None
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
 
     # ---- auth ----
 
@@ -104,9 +440,8 @@ class RedfishClient:
         if not (self.username and self.password):
             raise RedfishError("Username/password required for session login")
 
-        url = _safe_join(self.base_url, "/redfish/v1/SessionService/Sessions")
         resp = self._http.post(
-            url,
+            self._sessions_url,
             json={"UserName": self.username, "Password": self.password},
             timeout=self.timeout,
         )
@@ -130,75 +465,264 @@ class RedfishClient:
             self._session_token = None
             self._session_uri = None
             self._root = None
+            self._root_attr_cache.clear()
+            self.clear_cache()
 
     # ---- HTTP verbs ----
 
-    def get(self, path: str) -> dict[str, Any]:
-        url = _safe_join(self.base_url, path) if not path.startswith("http") else path
-        resp = self._http.get(url, timeout=self.timeout)
+    def _absurl(self, path: str) -> str:
+        return _safe_join(self.base_url, path)
+
+    def get(self, path: str, use_cache: bool = True) -> dict[str, Any]:
+        """
+        GET a resource as JSON. Responses fetched less than cache_ttl seconds ago
+        are returned without a request unless use_cache is False; older ones are
+        revalidated by ETag. Every call returns its own copy of the body, so
+        callers may mutate it without touching the cache.
+        """
+        url = self._absurl(path)
+        with self._lock:
+            entry = self._cache.get(url)
+            if entry and use_cache and time.monotonic() - entry[0] < self._cache_ttl:
+                self._cache.move_to_end(url)
+                return _copy_json(entry[2])
+        from_disk = entry is None and self.cache_dir is not None
+        if from_disk:
+            stored = self._load_disk_entry(url)
+            entry = (float("-inf"), *stored) if stored else None
+        etag = entry[1] if entry else None
+        headers = {"If-None-Match": etag} if etag else {}
+        resp = self._http.get(url, headers=headers, timeout=self.timeout)
+        if resp.status_code == HTTP_NOT_MODIFIED and etag and entry is not None:
+            cached: dict[str, Any] = entry[2]
+            self._store(url, etag, cached, persist=False)
+            return _copy_json(cached)
         if resp.status_code != HTTP_OK:
-            raise RedfishError(f"GET {url} -> {resp.status_code} {resp.text}")
+            raise RedfishError(
+                f"GET {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
         if not resp.content:
             return {}
         try:
-            return resp.json()
+            body = _json_loads(resp.content)
         except Exception:
             raise RedfishError(f"GET {url} returned non-JSON") from None
+        # Some BMCs omit the ETag header but carry the same value in the body
+        etag = resp.headers.get("ETag")
+        if not etag and isinstance(body, dict):
+            etag = body.get("@odata.etag")
+        self._store(url, etag, body)
+        return _copy_json(body)
+
+    def iter_members(self, path: str) -> Iterable[dict[str, Any]]:
+        """
+        Yield the Members of a collection one at a time, parsing each page
+        incrementally off the socket (and following Members@odata.nextLink).
+        Memory stays flat however large the collection, e.g. log entries.
+        Bypasses the response cache. Requires ijson: pip install rackfish[stream]
+        """
+        if ijson is None:
+            raise ImportError("iter_members requires ijson: pip install rackfish[stream]")
+        url: str | None = self._absurl(path)
+        while url:
+            next_link = None
+            with self._http.get(url, timeout=self.timeout, stream=True) as resp:
+                if resp.status_code != HTTP_OK:
+                    raise RedfishError(
+                        f"GET {url} -> {resp.status_code} {resp.text}",
+                        status_code=resp.status_code,
+                    )
+                resp.raw.decode_content = True
+                builder = None
+                for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "Members.item" and event in ("end_map", "end_array"):
+                            yield builder.value
+                            builder = None
+                    elif prefix == "Members.item" and event in ("start_map", "start_array"):
+                        builder = ijson.common.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "Members@odata.nextLink":
+                        next_link = value
+            url = self._absurl(next_link) if next_link else None
 
     def post(self, path: str, data: dict[str, Any] | None = None) -> dict[str, Any] | None:
-        url = _safe_join(self.base_url, path) if not path.startswith("http") else path
-        resp = self._http.post(url, json=data or {}, timeout=self.timeout)
+        url = self._absurl(path)
+        resp = self._http.post(
+            url,
+            data=_json_dumps(data) if data else _EMPTY_JSON,
+            headers=_JSON_CONTENT_TYPE,
+            timeout=self.timeout,
+        )
+        self._invalidate(url)
         if resp.status_code not in (200, 201, 202, 204):
-            raise RedfishError(f"POST {url} -> {resp.status_code} {resp.text}")
+            raise RedfishError(
+                f"POST {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
         if resp.status_code in (200, 201) and resp.content:
             try:
-                return resp.json()
+                return _json_loads(resp.content)
             except Exception:
                 return None
         return None
 
     def patch(self, path: str, data: dict[str, Any], etag: str | None = None) -> None:
-        url = _safe_join(self.base_url, path) if not path.startswith("http") else path
-        headers = {}
+        url = self._absurl(path)
+        headers = dict(_JSON_CONTENT_TYPE)
         if etag:
             headers["If-Match"] = etag
-        resp = self._http.patch(url, json=data, headers=headers, timeout=self.timeout)
+        resp = self._http.patch(url, data=_json_dumps(data), headers=headers, timeout=self.timeout)
+        self._invalidate(url)
         if resp.status_code not in (200, 204):
-            raise RedfishError(f"PATCH {url} -> {resp.status_code} {resp.text}")
+            raise RedfishError(
+                f"PATCH {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
 
     def delete(self, path: str) -> None:
-        url = _safe_join(self.base_url, path) if not path.startswith("http") else path
+        url = self._absurl(path)
         resp = self._http.delete(url, timeout=self.timeout)
+        self._invalidate(url)
         if resp.status_code not in (200, 204):
-            raise RedfishError(f"DELETE {url} -> {resp.status_code} {resp.text}")
+            raise RedfishError(
+                f"DELETE {url} -> {resp.status_code} {resp.text}", status_code=resp.status_code
+            )
+
+    # ---- response cache ----
+
+    def _store(
+        self, url: str, etag: str | None, body: dict[str, Any], persist: bool = True
+    ) -> None:
+        if persist and self.cache_dir:
+            self._write_disk_entry(url, etag, body)
+        with self._lock:
+            if (not etag and self._cache_ttl <= 0) or self._cache_size <= 0:
+                self._cache.pop(url, None)
+                return
+            self._cache[url] = (time.monotonic(), etag, body)
+            self._cache.move_to_end(url)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _invalidate(self, url: str) -> None:
+        """
+        Drop cached responses for url and its parents (collection, owning
+        resource), including query variants such as `?$filter=` or `?$expand=`.
+        """
+        with self._lock:
+            if not self._cache and not self.cache_dir:
+                return
+            stale = set()
+            path = url.split("?", 1)[0].rstrip("/")
+            while path and not path.endswith(":/"):
+                stale.add(path)
+                if self.cache_dir:
+                    # Disk entries are always revalidated by ETag, so only the
+                    # plain paths need removing there
+                    for key in (path, path + "/"):
+                        with contextlib.suppress(OSError):
+                            os.remove(self._disk_path(key))
+                path, sep, _ = path.rpartition("/")
+                if not sep:
+                    break
+            for key in [k for k in self._cache if k.split("?", 1)[0].rstrip("/") in stale]:
+                del self._cache[key]
+
+    def _disk_path(self, url: str) -> str:
+        cache_dir = self.cache_dir
+        assert cache_dir is not None  # only called when the disk cache is on
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(cache_dir, name + ".json")
+
+    def _load_disk_entry(self, url: str) -> tuple[str, dict[str, Any]] | None:
+        try:
+            with open(self._disk_path(url), "rb") as fh:
+                stored = _json_loads(fh.read())
+        except (OSError, ValueError):
+            return None
+        if stored.get("url") != url or not stored.get("etag"):
+            return None
+        return stored["etag"], stored["body"]
+
+    def _write_disk_entry(self, url: str, etag: str | None, body: dict[str, Any]) -> None:
+        target = self._disk_path(url)
+        if not etag:
+            with contextlib.suppress(OSError):
+                os.remove(target)
+            return
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(_json_dumps({"url": url, "etag": etag, "body": body}))
+            os.replace(tmp, target)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+
+    def clear_cache(self) -> None:
+        """
+        Forget all cached GET responses (and compiled ActionInfo) held in memory.
+        Files under cache_dir are kept; they are revalidated by ETag before use.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._action_info.clear()
+
+    def warmup(
+        self, names: Iterable[str] = ("Systems", "Chassis", "Managers"), max_workers: int = 8
+    ) -> None:
+        """
+        Fetch the members of the given root collections concurrently, filling the
+        response cache (and cache_dir, if set) ahead of use.
+        """
+        root = self.root
+        for name in names:
+            if name in root:
+                for _member in getattr(root, name).prefetch(max_workers=max_workers):
+                    pass
 
     # ---- navigation ----
 
     def connect(self) -> RedfishResource:
-        with self._lock:
-            if (
-                self.use_session_auth
-                and self.username
-                and self.password
-                and not self._session_token
-            ):
-                self.login()
-            root_json = self.get(self.base_url + "/redfish/v1")
-            self._root = RedfishResource(self, path=self.base_url, data=root_json, fetched=True)
-            return self._root
+        with self._connect_lock:
+            return self._connect()
+
+    def _connect(self) -> RedfishResource:
+        # Caller holds _connect_lock
+        if self.use_session_auth and self.username and self.password and not self._session_token:
+            self.login()
+        root_json = self.get(self._root_url)
+        self._root = RedfishResource(self, path=self.base_url, data=root_json, fetched=True)
+        self.__dict__.setdefault("_root_attr_cache", {}).clear()
+        return self._root
 
     @property
     def root(self) -> RedfishResource:
-        if self._root is None:
-            return self.connect()
-        return self._root
+        root = self._root
+        if root is None:
+            # Double-checked: threads that lost the race reuse the winner's root
+            with self._connect_lock:
+                root = self._root if self._root is not None else self._connect()
+        return root
 
     def __getattr__(self, name: str) -> Any:
         # Proxy unknown attributes to root (e.g., client.Systems)
         # If attribute doesn't exist but plural form exists with single member,
         # return that member directly (e.g., client.System -> client.Systems[0])
+        if name[:1] == "_":
+            # Private/dunder probes never reach the root; this also keeps a
+            # half-initialized client from recursing through self.root
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        # Resolved values are kept per name so repeated client.X is a dict hit.
+        # (via __dict__ so that clients built with __new__ work too)
+        cache = self.__dict__.setdefault("_root_attr_cache", {})
+        if name in cache:
+            return cache[name]
         try:
-            return getattr(self.root, name)
+            value = cache[name] = getattr(self.root, name)
+            return value
         except AttributeError as exc:
             # Try plural form for singular access convenience
             plural_name = name + "s"
@@ -209,7 +733,8 @@ class RedfishClient:
                     and hasattr(collection, "__iter__")
                     and len(collection) == 1
                 ):
-                    return next(iter(collection))
+                    value = cache[name] = next(iter(collection))
+                    return value
             except (AttributeError, TypeError):
                 pass
             # Re-raise original error
@@ -232,13 +757,36 @@ class RedfishResource:
     - Actions become callable methods; if ActionInfo present, inputs are validated
     """
 
+    # Fixed per-instance state lives in slots; "__dict__" stays for JSON properties,
+    # "__weakref__" keeps instances weak-referenceable.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_action_info_cache",
+        "_action_targets",
+        "_actions",
+        "_allowable",
+        "_available",
+        "_bound_actions",
+        "_client",
+        "_dir_cache",
+        "_fetched",
+        "_is_collection",
+        "_path",
+        "_pending",
+        "_raw",
+        "_surfaced",
+    )
+
     # Keys considered "meta" that won't be turned into normal attributes
-    _META_KEYS: ClassVar[set[str]] = {
-        "@odata.id",
-        "@odata.type",
-        "@odata.context",
-        "@odata.etag",
-    }
+    _META_KEYS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "@odata.id",
+            "@odata.type",
+            "@odata.context",
+            "@odata.etag",
+        }
+    )
 
     def __init__(
         self,
@@ -253,14 +801,45 @@ class RedfishResource:
         object.__setattr__(self, "_raw", data or {})
         object.__setattr__(self, "_is_collection", False)
 
-        # Internal cache for generated action validators: name -> schema
-        object.__setattr__(self, "_action_info_cache", {})
+        # ActionInfo loaded on first call: uri -> (schema, validator, hint), for
+        # clients other than RedfishClient (which shares one cache across
+        # resources). Created on first use, like _bound_actions: most members of
+        # a large collection never have an action invoked.
+        object.__setattr__(self, "_action_info_cache", None)
+
+        # Action functions by clean name (a table shared with every resource of
+        # the same Actions shape), bound to self on attribute access. This
+        # resource's own targets live in _action_targets: name -> (target,
+        # ActionInfo URI). Bound methods are cached weakly so repeated access
+        # returns the same object without the instance holding a reference
+        # cycle to itself.
+        object.__setattr__(self, "_actions", _NO_ACTIONS)
+        object.__setattr__(self, "_action_targets", None)
+        object.__setattr__(self, "_bound_actions", None)
+
+        # OEM/Links children surfaced to this object: name -> converted value
+        object.__setattr__(self, "_surfaced", {})
+
+        # Every name this resource answers to once hydrated (see _hydrate)
+        object.__setattr__(self, "_available", frozenset())
+
+        # "<prop>@Redfish.AllowableValues" lists, indexed by prop at hydration
+        object.__setattr__(self, "_allowable", {})
+
+        # Sorted dir() listing, built on first use and dropped on re-hydration
+        object.__setattr__(self, "_dir_cache", None)
+
+        # Property assignments queued inside `with resource:` (None outside)
+        object.__setattr__(self, "_pending", None)
 
         if data is None and path and not fetched:
             # Pure link stub; defer GET until used
             return
 
-        # If we have data, map to attributes
+        # If we have data, map to attributes. This is the only hydration an
+        # embedded object gets, so it counts as fetched from here on.
+        if self._raw:
+            object.__setattr__(self, "_fetched", True)
         self._hydrate(self._raw)
 
     # ---- core mapping ----
@@ -275,31 +854,40 @@ class RedfishResource:
             object.__setattr__(self, "_is_collection", True)
 
         # First pass: map properties (including nested dicts/lists)
+        meta = self._META_KEYS
+        assign = self._assign_property
         for key, value in obj.items():
-            if key in self._META_KEYS:
-                continue
-            self._assign_property(key, value)
+            if key not in meta:
+                assign(key, value)
 
-        # Second pass: surface OEM child objects and actions to main object
-        oem = obj.get("Oem", {})
-        if isinstance(oem, dict):
-            self._surface_oem_content(oem)
+        # Second pass: surface OEM vendor children and Links children to main object
+        self._surface_nested_content(obj)
 
-        # Third pass: surface Links child objects to main object
-        links = obj.get("Links", {})
-        if isinstance(links, dict):
-            self._surface_links_content(links)
-
-        # Fourth pass: generate action methods (including OEM actions)
+        # Third pass: generate action methods (including OEM actions)
         actions = obj.get("Actions", {})
         if isinstance(actions, dict):
             self._install_actions(actions)
 
+        # Fourth pass: index AllowableValues of properties, Boot and action parameters
+        self._index_allowable_values(obj)
+
+        # Capability set: properties, surfaced children and actions.
+        # Lets `name in resource` and failed hasattr() probes answer in O(1).
+        object.__setattr__(
+            self,
+            "_available",
+            frozenset((*self.__dict__, *self._surfaced, *self._actions, *obj)),
+        )
+        object.__setattr__(self, "_dir_cache", None)
+
     def _assign_property(self, key: str, value: Any) -> None:
         """
         Convert value into nested RedfishResource(s) where appropriate and attach as attribute or
         make accessible via item access if key is not a valid identifier.
         """
+        if key in _DEFERRED_KEYS:
+            # Built on first access (see __getattr__); value stays in _raw
+            return
         converted = self._convert(value)
         if _is_identifier(key):
             object.__setattr__(self, key, converted)
@@ -312,62 +900,44 @@ class RedfishResource:
         # Keep an easy view of JSON primitives when needed
         # (we already keep _raw)
 
-    def _surface_oem_content(self, oem: dict[str, Any]) -> None:
-        """
-        Surface vendor-specific OEM child objects and properties to main object.
-        Avoids name collisions by checking if attribute already exists.
-        """
-        for _vendor, vendor_data in oem.items():
-            if not isinstance(vendor_data, dict):
-                continue
-            for key, value in vendor_data.items():
-                # Skip if key already exists or is not a valid identifier
-                if not _is_identifier(key) or hasattr(self, key):
-                    continue
-                # Skip action keys (handled separately)
-                if key.startswith("#"):
-                    continue
-                # Surface the OEM child object/property to main object
-                converted = self._convert(value)
-                object.__setattr__(self, key, converted)
-
-    def _surface_links_content(self, links: dict[str, Any]) -> None:
+    def _surface_nested_content(self, obj: dict[str, Any]) -> None:
         """
-        Surface Links child objects to main object for easier navigation.
-        Avoids name collisions by checking if attribute already exists.
+        Surface OEM vendor children and Links children to main object in one pass.
+        Avoids name collisions: properties, earlier surfaced names and class
+        attributes win. Action keys ("#...") and meta keys are not identifiers.
         """
-        for key, value in links.items():
-            # Skip meta keys and existing attributes
-            if key in self._META_KEYS or not _is_identifier(key) or hasattr(self, key):
+        taken = self.__dict__
+        surfaced = self._surfaced
+        reserved = _reserved_names(type(self))
+        convert = self._convert
+        for key, value in _surfacing_candidates(obj):
+            if key in taken or key in surfaced or key in reserved or not _is_identifier(key):
                 continue
-            # Surface the linked resource to main object
-            converted = self._convert(value)
-            object.__setattr__(self, key, converted)
+            # Keys are interned like real attribute names so lookups by `name`
+            # hit the identity fast path
+            surfaced[sys.intern(key)] = convert(value)
 
     def _convert(self, value: Any) -> Any:
         """
         Recursively convert dicts/lists:
         - If dict has only @odata.id -> link stub (lazy)
-        - If dict contains '@odata.id' + other keys -> embedded object
-          (also lazy to avoid deep recursion)
+        - If dict contains '@odata.id' + other keys -> embedded object, hydrated
+          once from the data it carries; links inside it stay lazy
         - Lists -> convert each element
         - Primitives -> return as-is
         """
         if isinstance(value, dict):
-            if set(value.keys()) == {"@odata.id"}:
+            if len(value) == 1 and "@odata.id" in value:
                 return RedfishResource(
                     self._client, path=value["@odata.id"], data=None, fetched=False
                 )
-            # Even if it has @odata.id plus fields, defer hydration to avoid recursion depth issues
-            # Store the data but don't hydrate until first access
+            # Embedded object: hydrated from the data it carries, no GET
             return RedfishResource(
                 self._client, path=value.get("@odata.id"), data=value, fetched=False
             )
         if isinstance(value, list):
-            out = []
-            for elem in value:
-                out.append(self._convert(elem))
-            return out
+            # Primitives (most list elements) are copied without a call
+            return [self._convert(e) if isinstance(e, (dict, list)) else e for e in value]
         return value
 
     # ---- lazy load ----
@@ -375,15 +945,14 @@ class RedfishResource:
     def _ensure_fetched(self) -> None:
         if self._fetched:
             return
-        # If we have data already (embedded resource), just hydrate it without fetching
-        if self._raw:
-            object.__setattr__(self, "_fetched", True)
-            object.__setattr__(self, "_is_collection", isinstance(self._raw.get("Members"), list))
-            self._hydrate(self._raw)
-            return
-        # Otherwise, fetch from server if we have a path
+        # Embedded resources were hydrated in __init__; only link stubs get here.
+        # Fetch from server if we have a path
         if not self._path:
             return
+        if self._client is None:
+            raise RedfishError(
+                f"Resource {self._path} is not attached to a client; cannot fetch it"
+            )
         data = self._client.get(self._path)
         object.__setattr__(self, "_raw", data)
         object.__setattr__(self, "_fetched", True)
@@ -392,31 +961,78 @@ class RedfishResource:
 
     # ---- dict-like access for special keys ----
 
+    def _is_stub(self) -> bool:
+        """True for a link stub that has not been fetched yet."""
+        return not self._fetched and not self._raw and self._path is not None
+
     def __getitem__(self, key: str) -> Any:
+        if key == "@odata.id" and self._is_stub():
+            return self._path
         self._ensure_fetched()
         return self._raw[key]
 
     def get(self, key: str, default: Any = None) -> Any:
+        if key == "@odata.id" and self._is_stub():
+            return self._path
         self._ensure_fetched()
         return self._raw.get(key, default)
 
+    def keys(self) -> Iterable[str]:
+        """Keys of the underlying JSON payload (a view, no copy)."""
+        self._ensure_fetched()
+        return self._raw.keys()
+
+    def values(self) -> Iterable[Any]:
+        self._ensure_fetched()
+        return self._raw.values()
+
+    def items(self) -> Iterable[tuple[str, Any]]:
+        """(key, value) pairs of the JSON payload; one lookup per entry when iterating."""
+        self._ensure_fetched()
+        return self._raw.items()
+
     # ---- attribute access overrides ----
 
     def __getattr__(self, name: str) -> Any:
+        # Private and dunder probes (copy, pickle, inspect, IPython's
+        # _ipython_*/_repr_*_...) are never Redfish properties; answer them
+        # without fetching a link stub
+        if name[:1] == "_":
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         # Trigger lazy fetch for link stubs on first unknown attribute access
         self._ensure_fetched()
-        try:
-            return object.__getattribute__(self, name)
-        except AttributeError as exc:
-            # Not an attribute; maybe a JSON property with non-identifier key
-            if name in self._raw:
-                return self._raw[name]
-
-            # Try plural form for singular access convenience
-            # e.g., resource.Chassis -> resource.Chassis[0] if len == 1
-            plural_name = name + "s"
+        # Actions take precedence over surfaced OEM properties
+        action = self._actions.get(name)
+        if action is not None:
+            return self._bound_action(name, action)
+        # Surfaced OEM/Links children answer with a single dict probe
+        value = self._surfaced.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        available = self._available
+        if name in available:
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                if name in _DEFERRED_KEYS:
+                    converted = self._convert(self._raw[name])
+                    object.__setattr__(self, name, converted)
+                    return converted
+                # Not an attribute; maybe a JSON property with non-identifier key
+                if name in self._raw:
+                    return self._raw[name]
+
+        # Try plural form for singular access convenience
+        # e.g., resource.Chassis -> resource.Chassis[0] if len == 1, or
+        # collection.Member. A plural naming one of the class's own attributes
+        # (key -> keys) is never a collection.
+        plural_name = name + "s"
+        if plural_name in available and plural_name not in _class_names(type(self)):
             try:
-                collection = object.__getattribute__(self, plural_name)
+                collection = self._surfaced.get(plural_name, _MISSING)
+                if collection is _MISSING:
+                    collection = getattr(self, plural_name)
                 if (
                     hasattr(collection, "__len__")
                     and hasattr(collection, "__iter__")
@@ -426,9 +1042,12 @@ class RedfishResource:
             except (AttributeError, TypeError):
                 pass
 
-            raise AttributeError(
-                f"'{type(self).__name__}' object has no attribute '{name}'"
-            ) from exc
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __contains__(self, name: str) -> bool:
+        """`"Reset" in system`: O(1) check for a property, surfaced child or action."""
+        self._ensure_fetched()
+        return name in self._available
 
     def __setattr__(self, name: str, value: Any) -> None:
         # Allow setting simple existing properties via PATCH
@@ -438,9 +1057,15 @@ class RedfishResource:
 
         # If not yet fetched (link stub), fetch first so we know what's writable
         self._ensure_fetched()
+        object.__setattr__(self, "_dir_cache", None)
 
         if name in self._raw and not isinstance(self._raw[name], (dict, list)):
             # PATCH only simple properties by default; complex updates via .patch()
+            if self._pending is not None:
+                # Batching: sent as one PATCH when the with-block exits
+                self._pending[name] = value
+                object.__setattr__(self, name, value)
+                return
             etag = self._raw.get("@odata.etag")
             self._client.patch(self._path, {name: value}, etag=etag)
             self._raw[name] = value
@@ -449,19 +1074,223 @@ class RedfishResource:
             # Set as a Python-side attribute (or ask user to use .patch for complex)
             object.__setattr__(self, name, value)
 
+    def __enter__(self) -> RedfishResource:
+        """
+        Batch property assignments into a single PATCH:
+
+            with system:
+                system.AssetTag = "rack-12"
+                system.IndicatorLED = "Lit"
+
+        The PATCH is sent on exit; if the block raises, nothing is sent and the
+        assigned attributes revert to their last known values. They revert as
+        well if the PATCH itself fails, before its error propagates.
+        """
+        self._ensure_fetched()
+        object.__setattr__(self, "_pending", {})
+        return self
+
+    def __exit__(self, exc_type: Any, *_exc: Any) -> None:
+        pending = self._pending
+        object.__setattr__(self, "_pending", None)
+        if not pending:
+            return
+        if exc_type is None:
+            try:
+                self._client.patch(self._path, pending, etag=self._raw.get("@odata.etag"))
+            except BaseException:
+                self._revert(pending)
+                raise
+            self._raw.update(pending)
+        else:
+            self._revert(pending)
+
+    def _revert(self, pending: dict[str, Any]) -> None:
+        for name in pending:
+            object.__setattr__(self, name, self._raw[name])
+
+    def __dir__(self) -> Iterable[str]:
+        self._ensure_fetched()
+        if self._dir_cache is None:
+            names = set(super().__dir__())
+            names.update(self._surfaced, self._actions)
+            names.update(_DEFERRED_KEYS.intersection(self._raw))
+            listing = tuple(sorted(names))
+            object.__setattr__(self, "_dir_cache", listing)
+        return self._dir_cache
+
     # ---- collection protocols ----
 
-    def __iter__(self) -> Iterable[RedfishResource]:
+    def __iter__(self) -> Iterator[RedfishResource]:
         self._ensure_fetched()
         if not self._is_collection:
             raise TypeError(f"Resource at {self.identity} is not a collection")
-        members = self._raw.get("Members", [])
-        for m in members:
-            if isinstance(m, dict) and "@odata.id" in m:
-                yield RedfishResource(self._client, path=m["@odata.id"], data=None, fetched=False)
+        yield from self._iter_pages(self._raw)
+
+    def _iter_pages(self, page: dict[str, Any]) -> Iterator[RedfishResource]:
+        while True:
+            for m in page.get("Members", []):
+                if isinstance(m, dict) and "@odata.id" in m:
+                    # A bare link is a stub; anything more was inlined by the
+                    # service ($expand) and needs no GET of its own
+                    embedded = len(m) > 1
+                    yield RedfishResource(
+                        self._client,
+                        path=m["@odata.id"],
+                        data=m if embedded else None,
+                        fetched=embedded,
+                    )
+                else:
+                    # very rare, but support raw members
+                    yield RedfishResource(self._client, data=m, fetched=True)
+            # Large collections (e.g. log entries) are paged; fetch the next page
+            # only when the consumer has exhausted the current one
+            next_link = page.get("Members@odata.nextLink")
+            if not next_link:
+                return
+            page = self._client.get(next_link)
+
+    def filter(self, **criteria: Any) -> Iterable[RedfishResource]:
+        """
+        Iterate collection members whose properties equal the given values, e.g.
+        subs.filter(Destination="https://listener/events").
+        Asks the service with one `$filter` query; if the service rejects it, members
+        are fetched and compared locally, and the client remembers not to ask again.
+        Other failures (e.g. a 503) only fall back for this call.
+        Members are always checked against criteria, since some services ignore
+        query parameters they do not support and answer with the whole collection.
+        """
+        if not criteria:
+            yield from self
+            return
+        if self._fetched and not self._is_collection:
+            raise TypeError(f"Resource at {self.identity} is not a collection")
+        members: Iterable[RedfishResource] | None = None
+        client = self._client
+        unsupported = False
+        if (
+            self._path
+            and client is not None
+            and getattr(client, "_supports_filter", None) is not False
+        ):
+            expr = " and ".join(f"{k} eq {_odata_literal(v)}" for k, v in criteria.items())
+            sep = "&" if "?" in self._path else "?"
+            query = quote(expr, safe="'")
+            try:
+                page = client.get(f"{self._path}{sep}$filter={query}")
+            except RedfishError as exc:
+                page = None
+                unsupported = exc.status_code in _QUERY_REJECTED
+            if page is not None and isinstance(page.get("Members"), list):
+                client._supports_filter = True
+                members = self._iter_pages(page)
             else:
-                # very rare, but support raw members
-                yield RedfishResource(self._client, data=m, fetched=True)
+                # Answered without Members, or rejected outright
+                unsupported = unsupported or page is not None
+        if members is None:
+            self._ensure_fetched()
+            if not self._is_collection:
+                raise TypeError(f"Resource at {self.identity} is not a collection")
+            if unsupported:
+                # A real collection the service would not filter
+                client._supports_filter = False
+            members = iter(self)
+        for member in members:
+            if all(member.get(k, _MISSING) == v for k, v in criteria.items()):
+                yield member
+
+    def stream(self) -> Iterable[RedfishResource]:
+        """
+        Iterate a large collection (e.g. LogServices/.../Entries) without loading
+        whole pages into memory; see RedfishClient.iter_members. Members inlined
+        by the service come back hydrated, bare links as stubs.
+        """
+        if not self._path:
+            raise RedfishError("stream() requires a resource path")
+        yield from self._iter_pages({"Members": self._client.iter_members(self._path)})
+
+    def expand(self, levels: int = 1) -> Iterable[RedfishResource]:
+        """
+        Iterate a collection with its members inlined by the service, i.e. one
+        `$expand=.($levels=N)` GET instead of one GET for the collection and one
+        per member. Services that reject the query fall back to plain iteration,
+        and the client remembers not to ask again. Other failures (e.g. a 503)
+        only fall back for this call.
+        """
+        if self._fetched and not self._is_collection:
+            raise TypeError(f"Resource at {self.identity} is not a collection")
+        client = self._client
+        unsupported = False
+        if (
+            self._path
+            and client is not None
+            and getattr(client, "_supports_expand", None) is not False
+        ):
+            sep = "&" if "?" in self._path else "?"
+            try:
+                page = client.get(f"{self._path}{sep}$expand=.($levels={levels})")
+            except RedfishError as exc:
+                page = None
+                unsupported = exc.status_code in _QUERY_REJECTED
+            # The expanded page stands in for the plain GET of the collection
+            if page is not None and isinstance(page.get("Members"), list):
+                client._supports_expand = True
+                yield from self._iter_pages(page)
+                return
+            # Answered without Members, or rejected outright
+            unsupported = unsupported or page is not None
+        self._ensure_fetched()
+        if not self._is_collection:
+            raise TypeError(f"Resource at {self.identity} is not a collection")
+        if unsupported:
+            # A real collection the service would not expand
+            client._supports_expand = False
+        yield from self
+
+    def prefetch(self, max_workers: int = 8) -> Iterable[RedfishResource]:
+        """
+        Iterate a collection, GETting up to max_workers members concurrently.
+        Members are yielded in collection order and already hydrated, so
+        independent fetches overlap instead of paying one round-trip each.
+        """
+        members = list(self)
+        # Members the service inlined are already hydrated and need no worker
+        hydrated = [m._fetched for m in members]
+        stubs = [m for m, done in zip(members, hydrated) if not done]
+        if not stubs:
+            yield from members
+            return
+        with ThreadPoolExecutor(max_workers=self._workers(max_workers, len(stubs))) as pool:
+            fetched = pool.map(_fetch_member, stubs)
+            for member, done in zip(members, hydrated):
+                yield member if done else next(fetched)
+
+    def map(
+        self, fn: Callable[[RedfishResource], Any] | None = None, max_workers: int = 16
+    ) -> Iterable[Any]:
+        """
+        Fetch every member concurrently and apply fn to it on the worker thread,
+        so GETs made inside fn (e.g. lambda c: c.Thermal.Fans) overlap as well.
+        Results are yielded as they complete, not in collection order; without
+        fn the hydrated members themselves are yielded.
+        """
+        members = list(self)
+        if not members:
+            return
+
+        def work(member: RedfishResource) -> Any:
+            _fetch_member(member)
+            return fn(member) if fn is not None else member
+
+        with ThreadPoolExecutor(max_workers=self._workers(max_workers, len(members))) as pool:
+            for future in as_completed([pool.submit(work, m) for m in members]):
+                yield future.result()
+
+    def _workers(self, max_workers: int, jobs: int) -> int:
+        # More threads than pooled connections would only open (and discard)
+        # extra sockets, paying a TLS handshake each
+        pool_size = getattr(self._client, "pool_maxsize", max_workers)
+        return max(1, min(max_workers, jobs, pool_size))
 
     def __len__(self) -> int:
         self._ensure_fetched()
@@ -475,6 +1304,14 @@ class RedfishResource:
     def path(self) -> str | None:
         return self._path
 
+    @property
+    def member_id(self) -> str | None:
+        """
+        Id of a collection member derived from its URI, without fetching it.
+        Redfish member URIs end with the member Id; use .Id for the server's value.
+        """
+        return _id_from_path(self._path) if self._path else None
+
     @property
     def identity(self) -> str:
         self._ensure_fetched()
@@ -487,13 +1324,20 @@ class RedfishResource:
 
     def refresh(self) -> RedfishResource:
         self._ensure_fetched()
-        data = self._client.get(self._path)
+        data = self._client.get(self._path, use_cache=False)
+        if data == self._raw:
+            # Unchanged (typically revalidated with a 304): keep the hydrated tree
+            return self
         object.__setattr__(self, "_raw", data)
-        # reset attributes (re-hydrate). Start clean:
-        for k in list(self.__dict__.keys()):
-            if not k.startswith("_") and hasattr(self, k):
-                with contextlib.suppress(Exception):
-                    delattr(self, k)
+        # Re-hydrate from a clean slate. Fixed fields live in slots, so the
+        # instance dict holds only properties (and private user attributes)
+        props = self.__dict__
+        for k in [k for k in props if k[0] != "_"]:
+            del props[k]
+        self._surfaced.clear()
+        object.__setattr__(self, "_actions", _NO_ACTIONS)
+        object.__setattr__(self, "_action_targets", None)
+        object.__setattr__(self, "_bound_actions", None)
         self._hydrate(data)
         return self
 
@@ -527,56 +1371,77 @@ class RedfishResource:
 
     def _install_actions(self, actions: dict[str, Any]) -> None:
         # Standard actions and OEM nested under "Oem"
+        # e.g. {"Oem": {"Huawei": {"#ComputerSystem.FruControl": {...}}}}
+        entries = []
         for k, v in actions.items():
             if k == "Oem" and isinstance(v, dict):
-                # OEM -> vendors e.g. {"Huawei": {"#ComputerSystem.FruControl": {...}}}
-                for _vendor, vendor_actions in v.items():
-                    if not isinstance(vendor_actions, dict):
-                        continue
-                    for ak, av in vendor_actions.items():
-                        if ak.startswith("#"):
-                            self._bind_action(ak, av)
-            elif k.startswith("#"):
-                self._bind_action(k, v)
+                for vendor_actions in v.values():
+                    if isinstance(vendor_actions, dict):
+                        entries.extend(_action_entries(vendor_actions))
+            elif k.startswith("#") and isinstance(v, dict):
+                entries.append(_action_entry(k, v))
+        if not entries:
+            return
+        table = _action_table(tuple((name, uri is not None) for name, _target, uri in entries))
+        # Actions take precedence over properties and surfaced OEM content
+        instance_dict, surfaced = self.__dict__, self._surfaced
+        for name in table:
+            instance_dict.pop(name, None)
+            surfaced.pop(name, None)
+        object.__setattr__(self, "_actions", table)
+        object.__setattr__(
+            self, "_action_targets", {name: (target, uri) for name, target, uri in entries}
+        )
 
-    def _bind_action(self, action_name_with_hash: str, info: dict[str, Any]) -> None:
+    def _action_info_store(self) -> dict[str, tuple[Any, Any, str | None]]:
+        """Compiled ActionInfo by URI: the client's shared cache, or this resource's own."""
+        if isinstance(self._client, RedfishClient):
+            return self._client._action_info
+        info_cache = self._action_info_cache
+        if info_cache is None:
+            info_cache = {}
+            object.__setattr__(self, "_action_info_cache", info_cache)
+        return info_cache
+
+    def _action_validator(self, action_info_uri: str) -> Callable[[dict[str, Any]], None] | None:
         """
-        Create a method on this instance for the given action.
-        If @Redfish.ActionInfo is present, we pull parameter schema and validate kwargs on call.
+        Validator for an action's ActionInfo, fetched on the first call (not at
+        hydration, so resources whose actions are never invoked cost no extra GETs).
+        Compiled validators are kept per ActionInfo URI on the client, so members
+        sharing an ActionInfo fetch and compile it once.
         """
-        target = info.get("target")
-        action_info_uri = info.get("@Redfish.ActionInfo")
-
-        clean_name = action_name_with_hash.lstrip("#").split(".")[-1]  # e.g., "Reset"
-        validator = None
-        sig_hint = None
-
-        if action_info_uri:
+        info_cache = self._action_info_store()
+        cached = info_cache.get(action_info_uri)
+        if cached is None:
             try:
                 schema = self._client.get(action_info_uri)
                 validator, sig_hint = self._compile_action_validator(schema)
-                self._action_info_cache[clean_name] = schema
             except Exception:
-                # Best-effort; if fetch fails, still expose action without validation
-                validator = None
-
-        def _action_method(this: RedfishResource, **kwargs):
-            if not target:
-                raise RedfishError(f"Action '{clean_name}' has no target")
-            if validator:
-                validator(kwargs)
-            # POST to action target with kwargs (or {} if none)
-            return this._client.post(target, data=(kwargs or {}))
-
-        # Attach __name__ for nicer repr; include signature hint as doc
-        _action_method.__name__ = clean_name
-        doc_hint = f"Dynamic Redfish action {clean_name}"
-        if sig_hint:
-            doc_hint += f" | params: {sig_hint}"
-        _action_method.__doc__ = doc_hint
-
-        # Bind to instance
-        object.__setattr__(self, clean_name, _action_method.__get__(self, RedfishResource))
+                # Best-effort; if fetch fails, still expose action without
+                # validation, and try again on the next call
+                return None
+            cached = info_cache[action_info_uri] = (schema, validator, sig_hint)
+        return cached[1]
+
+    def _action_hint(self, name: str) -> str | None:
+        """Parameter hint from this resource's ActionInfo for action name, once loaded."""
+        targets = self._action_targets
+        uri = targets[name][1] if targets and name in targets else None
+        if not uri:
+            return None
+        cached = self._action_info_store().get(uri)
+        return cached[2] if cached is not None else None
+
+    def _bound_action(self, name: str, func: Callable[..., Any]) -> _BoundAction:
+        cache = self._bound_actions
+        if cache is None:
+            cache = WeakValueDictionary()
+            object.__setattr__(self, "_bound_actions", cache)
+        bound = cache.get(name)
+        if bound is None:
+            bound = _BoundAction(func, self)
+            cache[name] = bound
+        return bound
 
     def _compile_action_validator(self, schema: dict[str, Any]):
         """
@@ -593,29 +1458,49 @@ class RedfishResource:
         params = schema.get("Parameters") or schema.get("parameters") or []
         expected = {p.get("Name"): p for p in params if isinstance(p, dict) and p.get("Name")}
 
+        # Everything the validator needs is resolved here, once per ActionInfo:
+        # name -> (dtype, accepted types, reject bool, allowable list, allowable set)
+        required = tuple(n for n, p in expected.items() if p.get("Required"))
+        names = frozenset(expected)
+        checks = {}
+        for n, p in expected.items():
+            dtype = p.get("DataType")
+            allow = p.get("AllowableValues") or None
+            checks[n] = (
+                dtype,
+                _DTYPE_TYPES.get(dtype) if dtype else None,
+                dtype in _DTYPE_NOT_BOOL,
+                allow,
+                _allowed_set(allow) if allow else None,
+            )
+
         def validator(kwargs: dict[str, Any]) -> None:
             # required
-            missing = [n for n, p in expected.items() if p.get("Required") and n not in kwargs]
+            missing = [n for n in required if n not in kwargs]
             if missing:
                 raise RedfishError(f"Missing required action parameter(s): {', '.join(missing)}")
 
             # unknown
-            unknown = [k for k in kwargs if k not in expected]
-            if unknown:
+            if not names.issuperset(kwargs):
+                unknown = [k for k in kwargs if k not in names]
                 raise RedfishError(f"Unknown action parameter(s): {', '.join(unknown)}")
 
             # types & allowable values
-            for name, p in expected.items():
-                if name not in kwargs:
-                    continue
-                val = kwargs[name]
-                dtype = p.get("DataType")
-                if dtype and not _dtype_matches(val, dtype):
+            for name, val in kwargs.items():
+                dtype, types, not_bool, allow, allowed = checks[name]
+                if types is not None and (
+                    not isinstance(val, types) or (not_bool and isinstance(val, bool))
+                ):
                     raise RedfishError(
                         f"Parameter '{name}' expects {dtype}, got {type(val).__name__}"
                     )
-                allow = p.get("AllowableValues")
-                if allow and val not in allow:
+                if allow is None:
+                    continue
+                try:
+                    ok = val in allowed if allowed is not None else val in allow
+                except TypeError:  # unhashable value against a set
+                    ok = val in allow
+                if not ok:
                     raise RedfishError(f"Parameter '{name}' must be one of {allow}; got '{val}'")
 
         # Signature hint string (human-readable)
@@ -634,18 +1519,64 @@ class RedfishResource:
 
     # ---- helpers ----
 
-    def get_allowable_values(self, prop_name: str) -> list[Any] | None:
+    def _index_allowable_values(self, obj: dict[str, Any]) -> None:
+        """
+        Collect '<name>@Redfish.AllowableValues' annotations into self._allowable.
+        Own properties win over the Boot subtree, which wins over action parameters.
         """
-        Return AllowableValues list for a property if present as '<prop>@Redfish.AllowableValues'.
+        allowable: dict[str, tuple[Any, ...]] = {}
+
+        def scan(node: Any) -> None:
+            if not isinstance(node, dict):
+                return
+            for key, values in node.items():
+                if key.endswith(_ALLOWABLE_SUFFIX) and isinstance(values, list):
+                    allowable.setdefault(key[: -len(_ALLOWABLE_SUFFIX)], tuple(values))
+
+        scan(obj)
+        scan(obj.get("Boot"))
+        actions = obj.get("Actions")
+        if isinstance(actions, dict):
+            for name, info in actions.items():
+                if name == "Oem" and isinstance(info, dict):
+                    for vendor_actions in info.values():
+                        if isinstance(vendor_actions, dict):
+                            for vendor_info in vendor_actions.values():
+                                scan(vendor_info)
+                else:
+                    scan(info)
+        object.__setattr__(self, "_allowable", allowable)
+
+    def get_allowable_values(self, prop_name: str) -> tuple[Any, ...] | None:
+        """
+        Return AllowableValues for a property or action parameter, as annotated by
+        '<prop>@Redfish.AllowableValues' on the resource, its Boot object or its Actions.
         """
         self._ensure_fetched()
-        key = f"{prop_name}@Redfish.AllowableValues"
-        return self._raw.get(key)
+        return self._allowable.get(prop_name)
+
+    # ---- pickling ----
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The client (HTTP session, credentials) and bound actions stay behind;
+        # everything else is rebuilt from the JSON payload on unpickling.
+        return {"path": self._path, "raw": self._raw, "fetched": self._fetched}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        RedfishResource.__init__(
+            self,
+            None,  # type: ignore[arg-type]
+            path=state["path"],
+            data=state["raw"] or None,
+            fetched=state["fetched"],
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Return the raw JSON (fetched on demand)."""
         self._ensure_fetched()
-        return json.loads(json.dumps(self._raw))  # deep copy
+        if orjson is not None:
+            return orjson.loads(orjson.dumps(self._raw))  # deep copy in C
+        return _copy_json(self._raw)
 
     def __repr__(self) -> str:
         t = self._raw.get("@odata.type", "Resource")
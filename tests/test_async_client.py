@@ -0,0 +1,88 @@
+"""
+Test AsyncRedfishClient against an in-memory httpx transport.
+Skipped when the optional httpx dependency is not installed.
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from rackfish import AsyncRedfishClient, RedfishError  # noqa: E402
+
+RESOURCES = {
+    "/redfish/v1/Systems": {
+        "Members": [{"@odata.id": "/redfish/v1/Systems/1"}],
+        "Members@odata.nextLink": "/redfish/v1/Systems?$skip=1",
+    },
+    "/redfish/v1/Systems?$skip=1": {"Members": [{"@odata.id": "/redfish/v1/Systems/2"}]},
+    "/redfish/v1/Systems/1": {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Id": "1",
+        "Actions": {
+            "#ComputerSystem.Reset": {
+                "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset",
+                "@Redfish.ActionInfo": "/redfish/v1/Systems/1/ResetActionInfo",
+            }
+        },
+    },
+    "/redfish/v1/Systems/2": {"@odata.id": "/redfish/v1/Systems/2", "Id": "2"},
+}
+
+
+def _handler(request):
+    path = request.url.raw_path.decode()
+    if path not in RESOURCES:
+        return httpx.Response(404, text="not found")
+    return httpx.Response(200, json=RESOURCES[path])
+
+
+def _client():
+    return AsyncRedfishClient(
+        "https://bmc", use_session=False, transport=httpx.MockTransport(_handler)
+    )
+
+
+def test_gather_members_follows_pages():
+    """Test that gather_members returns every member, in collection order."""
+
+    async def run():
+        client = _client()
+        try:
+            return await client.gather_members("/redfish/v1/Systems")
+        finally:
+            await client._http.aclose()
+
+    systems = asyncio.run(run())
+    assert [s.Id for s in systems] == ["1", "2"]
+
+
+def test_get_errors_raise_redfish_error():
+    """Test that non-200 responses raise RedfishError."""
+
+    async def run():
+        client = _client()
+        try:
+            await client.get("/redfish/v1/Missing")
+        finally:
+            await client._http.aclose()
+
+    with pytest.raises(RedfishError):
+        asyncio.run(run())
+
+
+def test_actions_on_detached_resources_raise():
+    """Test that calling an action on a fetched snapshot raises RedfishError."""
+
+    async def run():
+        client = _client()
+        try:
+            return await client.resource("/redfish/v1/Systems/1")
+        finally:
+            await client._http.aclose()
+
+    system = asyncio.run(run())
+    assert "Reset" in system
+    with pytest.raises(RedfishError, match="not attached to a client"):
+        system.Reset(ResetType="On")
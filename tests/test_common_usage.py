@@ -3,58 +3,65 @@
 Test the most common Redfish usage cases for pyredfisher.
 """
 
-import sys
+import json
+import pickle
 
-sys.path.insert(0, ".")
+import pytest
 
-from rackfish import RedfishClient, RedfishResource
+from rackfish import RedfishClient, RedfishError, RedfishResource
+
+_MOCK_DATA = {
+    "/redfish/v1": {
+        "Systems": {"@odata.id": "/redfish/v1/Systems"},
+        "Managers": {"@odata.id": "/redfish/v1/Managers"},
+        "SessionService": {"@odata.id": "/redfish/v1/SessionService"},
+    },
+    "/redfish/v1/Systems": {
+        "Members": [
+            {"@odata.id": "/redfish/v1/Systems/1"},
+            {"@odata.id": "/redfish/v1/Systems/2"},
+        ]
+    },
+    "/redfish/v1/Systems/1": {
+        "Id": "1",
+        "Name": "System1",
+        "PowerState": "On",
+        "Oem": {"Vendor": {"CustomProp": "Value1"}},
+        "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}]},
+        "Actions": {
+            "#ComputerSystem.Reset": {
+                "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset"
+            }
+        },
+    },
+    "/redfish/v1/Systems/2": {
+        "Id": "2",
+        "Name": "System2",
+        "PowerState": "Off",
+        "Oem": {"Vendor": {"CustomProp": "Value2"}},
+        "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/2"}]},
+        "Actions": {
+            "#ComputerSystem.Reset": {
+                "target": "/redfish/v1/Systems/2/Actions/ComputerSystem.Reset"
+            }
+        },
+    },
+    "/redfish/v1/Chassis/1": {"Id": "Chassis1", "Name": "Chassis1"},
+    "/redfish/v1/Chassis/2": {"Id": "Chassis2", "Name": "Chassis2"},
+}
+
+# Parsing a fresh copy is several times faster than copy.deepcopy
+_MOCK_JSON = json.dumps(_MOCK_DATA)
 
 
 # Mock RedfishClient for testing (no real HTTP calls)
 class MockClient:
     def __init__(self):
         self.base_url = "http://mock"
-        self._data = {
-            "/redfish/v1": {
-                "Systems": {"@odata.id": "/redfish/v1/Systems"},
-                "Managers": {"@odata.id": "/redfish/v1/Managers"},
-                "SessionService": {"@odata.id": "/redfish/v1/SessionService"},
-            },
-            "/redfish/v1/Systems": {
-                "Members": [
-                    {"@odata.id": "/redfish/v1/Systems/1"},
-                    {"@odata.id": "/redfish/v1/Systems/2"},
-                ]
-            },
-            "/redfish/v1/Systems/1": {
-                "Id": "1",
-                "Name": "System1",
-                "PowerState": "On",
-                "Oem": {"Vendor": {"CustomProp": "Value1"}},
-                "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}]},
-                "Actions": {
-                    "#ComputerSystem.Reset": {
-                        "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset"
-                    }
-                },
-            },
-            "/redfish/v1/Systems/2": {
-                "Id": "2",
-                "Name": "System2",
-                "PowerState": "Off",
-                "Oem": {"Vendor": {"CustomProp": "Value2"}},
-                "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/2"}]},
-                "Actions": {
-                    "#ComputerSystem.Reset": {
-                        "target": "/redfish/v1/Systems/2/Actions/ComputerSystem.Reset"
-                    }
-                },
-            },
-            "/redfish/v1/Chassis/1": {"Id": "Chassis1", "Name": "Chassis1"},
-            "/redfish/v1/Chassis/2": {"Id": "Chassis2", "Name": "Chassis2"},
-        }
+        # tests patch and extend the payloads, so each client gets its own copy
+        self._data = json.loads(_MOCK_JSON)
 
-    def get(self, path):
+    def get(self, path, **_kwargs):
         return self._data.get(path, {})
 
     def post(self, path, data=None):
@@ -67,101 +74,401 @@ class MockClient:
         return {"result": "deleted", "path": path}
 
 
-def test_basic_traversal():
+def _fetched(client, path):
+    """Wrap the mock payload at path as an already-fetched resource."""
+    return RedfishResource(client, path=path, data=client.get(path), fetched=True)
+
+
+@pytest.fixture
+def client():
+    """A fresh mock client per test, since tests extend and patch its payloads."""
+    return MockClient()
+
+
+@pytest.fixture
+def system1(client):
+    """/redfish/v1/Systems/1 wrapped as an already-fetched resource."""
+    return _fetched(client, "/redfish/v1/Systems/1")
+
+
+def test_basic_traversal(client, system1):
     print("Test: Basic Redfish resource traversal and collection iteration")
-    client = MockClient()
-    root = RedfishResource(client, path="/redfish/v1", data=client.get("/redfish/v1"), fetched=True)
-    systems = RedfishResource(
-        client, path="/redfish/v1/Systems", data=client.get("/redfish/v1/Systems"), fetched=True
-    )
+    root = _fetched(client, "/redfish/v1")
+    systems = _fetched(client, "/redfish/v1/Systems")
 
     # Iterate over the collection
     system_objs = list(systems)
     assert len(system_objs) == 2
 
     # Access properties on the resources
-    sys1 = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
-    )
-    sys2 = RedfishResource(
-        client, path="/redfish/v1/Systems/2", data=client.get("/redfish/v1/Systems/2"), fetched=True
-    )
-    assert sys1.Name == "System1"
+    sys2 = _fetched(client, "/redfish/v1/Systems/2")
+    assert system1.Name == "System1"
     assert sys2.PowerState == "Off"
     print("  Traversal and collection iteration: OK")
-    return True
 
 
-def test_oem_links_surfacing():
-    print("Test: OEM and Links surfacing")
-    client = MockClient()
+def test_embedded_hydrated_once(client):
+    print("Test: embedded objects are hydrated once and not rebuilt on a miss")
     system = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
+        client,
+        data={"Boot": {"BootSourceOverrideTarget": "Pxe", "Settings": {"Mode": "UEFI"}}},
+        fetched=True,
     )
+    boot = system.Boot
+    settings = boot.Settings
+    assert not hasattr(boot, "Missing")
+    assert boot.Settings is settings, "a failed lookup must not re-hydrate the object"
+    assert boot.BootSourceOverrideTarget == "Pxe"
+    print("  Embedded hydration: OK")
+
+
+def test_paged_collection_iteration(client):
+    print("Test: Collection iteration follows Members@odata.nextLink lazily")
+    client._data["/redfish/v1/Systems"] = {
+        "Members": [{"@odata.id": "/redfish/v1/Systems/1"}],
+        "Members@odata.nextLink": "/redfish/v1/Systems?$skip=1",
+    }
+    client._data["/redfish/v1/Systems?$skip=1"] = {
+        "Members": [{"@odata.id": "/redfish/v1/Systems/2"}],
+    }
+    requested = []
+    get = client.get
+    client.get = lambda path: requested.append(path) or get(path)
+    systems = _fetched(client, "/redfish/v1/Systems")
+    requested.clear()
+
+    # Stopping after the first member never requests the second page
+    assert next(iter(systems)).path == "/redfish/v1/Systems/1"
+    assert requested == []
+
+    assert [s.path for s in systems] == ["/redfish/v1/Systems/1", "/redfish/v1/Systems/2"]
+    assert requested == ["/redfish/v1/Systems?$skip=1"]
+    print("  Paged iteration: OK")
+
+
+def test_prefetch_members(client):
+    print("Test: prefetch() yields hydrated members in collection order")
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    fetched = list(systems.prefetch(max_workers=2))
+    assert [s.path for s in fetched] == ["/redfish/v1/Systems/1", "/redfish/v1/Systems/2"]
+    assert all(s._fetched for s in fetched)
+    assert [s.PowerState for s in fetched] == ["On", "Off"]
+
+    # Members inlined in the collection page are not fetched again
+    client._data["/redfish/v1/Systems"]["Members"][0] = {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "PowerState": "On",
+    }
+    requested = []
+    get = client.get
+    client.get = lambda path, **_kw: requested.append(path) or get(path)
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.PowerState for s in systems.prefetch()] == ["On", "Off"]
+    assert requested == ["/redfish/v1/Systems", "/redfish/v1/Systems/2"]
+    print("  Prefetch: OK")
+
+
+def test_map_members(client):
+    print("Test: map() applies a function to every member concurrently")
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert sorted(systems.map(lambda s: s.PowerState, max_workers=2)) == ["Off", "On"]
+    assert sorted(s.Id for s in systems.map()) == ["1", "2"]
+    print("  Map: OK")
+
+
+def test_allowable_values(client):
+    print("Test: get_allowable_values() covers properties, Boot and action parameters")
+    system = RedfishResource(
+        client,
+        data={
+            "Boot": {
+                "BootSourceOverrideTarget": "Pxe",
+                "BootSourceOverrideTarget@Redfish.AllowableValues": ["None", "Pxe", "Hdd"],
+            },
+            "Actions": {
+                "#ComputerSystem.Reset": {
+                    "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset",
+                    "ResetType@Redfish.AllowableValues": ["On", "ForceOff"],
+                }
+            },
+        },
+        fetched=True,
+    )
+    assert system.get_allowable_values("ResetType") == ("On", "ForceOff")
+    assert system.get_allowable_values("BootSourceOverrideTarget") == ("None", "Pxe", "Hdd")
+    assert system.get_allowable_values("PowerState") is None
+    print("  Allowable values: OK")
+
+
+def test_pickle_roundtrip(client):
+    print("Test: resources pickle without their client")
+    system = RedfishResource(client, path="/redfish/v1/Systems/1")
+    assert system.PowerState == "On"
+
+    restored = pickle.loads(pickle.dumps(system))  # noqa: S301 - round-trips our own object
+    assert restored.path == "/redfish/v1/Systems/1"
+    assert restored.PowerState == "On"
+    assert restored.CustomProp == "Value1"
+    assert callable(restored.Reset)
+    assert restored._client is None
+    with pytest.raises(RedfishError, match="not attached to a client"):
+        restored.Reset(ResetType="On")
+    print("  Pickle: OK")
+
+
+def test_collection_filter(client):
+    print("Test: filter() uses $filter and falls back to local matching")
+    client._data["/redfish/v1/Systems?$filter=PowerState%20eq%20'Off'"] = {
+        "Members": [{"@odata.id": "/redfish/v1/Systems/2"}],
+    }
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.path for s in systems.filter(PowerState="Off")] == ["/redfish/v1/Systems/2"]
+    assert client._supports_filter is True
+
+    # A service without $filter support answers locally and is not asked again
+    client = MockClient()
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.Id for s in systems.filter(PowerState="On")] == ["1"]
+    assert client._supports_filter is False
+
+    # A service that ignores $filter returns every member; only matches are yielded
+    client = MockClient()
+    client._data["/redfish/v1/Systems?$filter=PowerState%20eq%20'Off'"] = client._data[
+        "/redfish/v1/Systems"
+    ]
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.Id for s in systems.filter(PowerState="Off")] == ["2"]
+
+    # A transient failure falls back for this call only
+    client = MockClient()
+    get = client.get
+
+    def unavailable(path, **_kwargs):
+        if "$filter" in path:
+            raise RedfishError("GET -> 503", status_code=503)
+        return get(path)
+
+    client.get = unavailable
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.Id for s in systems.filter(PowerState="Off")] == ["2"]
+    assert not hasattr(client, "_supports_filter")
+
+    # A non-collection is rejected without marking $filter as unsupported
+    client = MockClient()
+    system = RedfishResource(client, path="/redfish/v1/Systems/1")
+    with pytest.raises(TypeError):
+        next(system.filter(PowerState="On"))
+    assert not hasattr(client, "_supports_filter")
+
+    # A detached stub cannot be filtered
+    with pytest.raises(RedfishError, match="not attached to a client"):
+        next(RedfishResource(None, path="/redfish/v1/Systems").filter(PowerState="On"))
+    print("  Filter: OK")
+
+
+def test_collection_expand(client):
+    print("Test: expand() inlines members with one $expand GET")
+    client._data["/redfish/v1/Systems?$expand=.($levels=1)"] = {
+        "Members": [client._data[f"/redfish/v1/Systems/{i}"] for i in ("1", "2")],
+    }
+    client._data["/redfish/v1/Systems/1"]["@odata.id"] = "/redfish/v1/Systems/1"
+    client._data["/redfish/v1/Systems/2"]["@odata.id"] = "/redfish/v1/Systems/2"
+    requested = []
+    get = client.get
+    client.get = lambda path, **_kw: requested.append(path) or get(path)
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+
+    assert [s.Id for s in systems.expand()] == ["1", "2"]
+    # The expanded page replaces the plain GET of the collection
+    assert requested == ["/redfish/v1/Systems?$expand=.($levels=1)"]
+    assert client._supports_expand is True
+
+    # Without $expand support members are fetched one by one, as with iter()
+    client = MockClient()
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.Id for s in systems.expand()] == ["1", "2"]
+    assert client._supports_expand is False
+
+    # A transient failure falls back for this call only; the next call expands
+    client = MockClient()
+    expanded = "/redfish/v1/Systems?$expand=.($levels=1)"
+    client._data[expanded] = {"Members": [{"@odata.id": "/redfish/v1/Systems/1", "Id": "1"}]}
+    get = client.get
+    failures = [RedfishError(f"GET {expanded} -> 503", status_code=503)]
+
+    def flaky(path, **_kwargs):
+        if path == expanded and failures:
+            raise failures.pop()
+        return get(path)
+
+    client.get = flaky
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.Id for s in systems.expand()] == ["1", "2"]
+    assert not hasattr(client, "_supports_expand")
+    systems = RedfishResource(client, path="/redfish/v1/Systems")
+    assert [s.Id for s in systems.expand()] == ["1"]
+    assert client._supports_expand is True
+
+    # A non-collection is rejected without marking $expand as unsupported
+    client = MockClient()
+    system = RedfishResource(client, path="/redfish/v1/Systems/1")
+    with pytest.raises(TypeError):
+        next(system.expand())
+    assert not hasattr(client, "_supports_expand")
+    print("  Expand: OK")
+
+
+def test_to_dict_is_deep_copy(client, system1):
+    print("Test: to_dict() returns an independent copy of the JSON")
+    snapshot = system1.to_dict()
+    assert snapshot == client.get("/redfish/v1/Systems/1")
+    snapshot["Oem"]["Vendor"]["CustomProp"] = "Changed"
+    snapshot["Links"]["Chassis"].clear()
+    assert system1.to_dict()["Oem"]["Vendor"]["CustomProp"] == "Value1"
+    assert len(system1.to_dict()["Links"]["Chassis"]) == 1
+    print("  to_dict: OK")
+
+
+def test_dunder_probes_do_not_fetch(client):
+    print("Test: introspection probes on a link stub make no request")
+    requested = []
+    get = client.get
+    client.get = lambda path, **_kw: requested.append(path) or get(path)
+    stub = RedfishResource(client, path="/redfish/v1/Systems/1")
+    assert not hasattr(stub, "__wrapped__")
+    assert not hasattr(stub, "__array__")
+    assert not hasattr(stub, "_ipython_canary_method_should_not_exist_")
+    assert requested == []
+    print("  Dunder probes: OK")
+
+
+def test_mapping_views(client):
+    print("Test: keys()/items() expose the JSON payload of an embedded object")
+    bios = RedfishResource(
+        client, data={"Attributes": {"BootMode": "UEFI", "QuickBoot": True}}, fetched=True
+    )
+    attrs = bios.Attributes
+    assert list(attrs.keys()) == ["BootMode", "QuickBoot"]
+    assert list(attrs.items()) == [("BootMode", "UEFI"), ("QuickBoot", True)]
+    assert list(attrs.values()) == ["UEFI", True]
+    print("  Mapping views: OK")
+
+
+def test_oem_links_surfacing(client, system1):
+    print("Test: OEM and Links surfacing")
     # OEM property surfaced
-    assert hasattr(system, "CustomProp")
-    assert system.CustomProp == "Value1"
+    assert hasattr(system1, "CustomProp")
+    assert system1.CustomProp == "Value1"
     # Links property surfaced (Chassis is a list of link stubs)
-    assert hasattr(system, "Chassis")
-    chassis_list = list(system.Chassis)
+    assert hasattr(system1, "Chassis")
+    chassis_list = list(system1.Chassis)
     assert len(chassis_list) == 1
     # Fetch the first chassis
-    chassis = RedfishResource(
-        client, path="/redfish/v1/Chassis/1", data=client.get("/redfish/v1/Chassis/1"), fetched=True
-    )
+    chassis = _fetched(client, "/redfish/v1/Chassis/1")
     assert chassis.Name == "Chassis1"
     print("  OEM/Links surfacing: OK")
-    return True
 
 
-def test_action_invocation():
+def test_action_invocation(system1):
     print("Test: Action invocation (Reset)")
-    client = MockClient()
-    system = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
-    )
     # Simulate action call
-    result = system.Reset(ResetType="On")
+    result = system1.Reset(ResetType="On")
     assert result["result"] == "ok"
     print("  Action invocation: OK")
-    return True
 
 
-def test_patch_update():
-    print("Test: PATCH update via attribute assignment")
-    client = MockClient()
+def test_action_info_loaded_on_first_call(client):
+    print("Test: ActionInfo is fetched when the action is first called")
+    client._data["/redfish/v1/Systems/1/ResetActionInfo"] = {
+        "Parameters": [{"Name": "ResetType", "Required": True, "AllowableValues": ["On"]}]
+    }
+    requested = []
+    get = client.get
+    client.get = lambda path, **_kw: requested.append(path) or get(path)
     system = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
+        client,
+        data={
+            "Actions": {
+                "#ComputerSystem.Reset": {
+                    "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset",
+                    "@Redfish.ActionInfo": "/redfish/v1/Systems/1/ResetActionInfo",
+                }
+            }
+        },
+        fetched=True,
     )
+    assert requested == []
+
+    assert system.Reset(ResetType="On")["result"] == "ok"
+    with pytest.raises(RedfishError, match="ResetType"):
+        system.Reset(ResetType="Off")
+    assert requested == ["/redfish/v1/Systems/1/ResetActionInfo"]
+    assert "ResetType" in system.Reset.__doc__
+    print("  Deferred ActionInfo: OK")
+
+
+def test_action_info_hint_is_per_resource(client):
+    print("Test: ActionInfo hints stay on the resource that loaded them")
+    client._data["/redfish/v1/Systems/1/ResetActionInfo"] = {
+        "Parameters": [{"Name": "ResetType", "AllowableValues": ["On"]}]
+    }
+
+    def system(n):
+        reset = {
+            "target": f"/redfish/v1/Systems/{n}/Actions/ComputerSystem.Reset",
+            "@Redfish.ActionInfo": f"/redfish/v1/Systems/{n}/ResetActionInfo",
+        }
+        return RedfishResource(client, data={"Actions": {"#ComputerSystem.Reset": reset}})
+
+    first, second = system(1), system(2)
+    first.Reset(ResetType="On")
+    # Both share one action function, but only the first has loaded its ActionInfo
+    assert first._actions is second._actions
+    assert "ResetType" in first.Reset.__doc__
+    assert "ResetType" not in second.Reset.__doc__
+    print("  Per-resource hints: OK")
+
+
+def test_failed_action_info_fetch_is_retried(client):
+    print("Test: a failed ActionInfo fetch is not cached")
+    info = "/redfish/v1/Systems/1/ResetActionInfo"
+    client._data[info] = {"Parameters": [{"Name": "ResetType", "AllowableValues": ["On"]}]}
+    requested = []
+    get = client.get
+
+    def flaky(path, **_kwargs):
+        requested.append(path)
+        if len(requested) == 1:
+            raise RedfishError(f"GET {path} -> 503", status_code=503)
+        return get(path)
+
+    client.get = flaky
+    reset = {
+        "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset",
+        "@Redfish.ActionInfo": info,
+    }
+    system = RedfishResource(client, data={"Actions": {"#ComputerSystem.Reset": reset}})
+
+    system.Reset(ResetType="Off")  # unvalidated while ActionInfo is unavailable
+    with pytest.raises(RedfishError, match="ResetType"):
+        system.Reset(ResetType="Off")
+    assert requested == [info, info]
+    print("  ActionInfo retry: OK")
+
+
+def test_patch_update(system1):
+    print("Test: PATCH update via attribute assignment")
     # Simulate PATCH
-    system.PowerState = "ForceOff"
+    system1.PowerState = "ForceOff"
     print("  PATCH update: OK")
-    return True
 
 
-def test_create_delete():
+def test_create_delete(client, system1):
     print("Test: Create and delete resource in collection")
-    client = MockClient()
-    systems = RedfishResource(
-        client, path="/redfish/v1/Systems", data=client.get("/redfish/v1/Systems"), fetched=True
-    )
+    systems = _fetched(client, "/redfish/v1/Systems")
     # Simulate create
     new = systems.create({"Id": "3", "Name": "System3"})
     assert new is not None or systems.refresh() is None
     # Simulate delete
-    system = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
-    )
-    system.delete()
+    system1.delete()
     print("  Create/Delete: OK")
-    return True
-
-
-if __name__ == "__main__":
-    all_passed = True
-    all_passed &= test_basic_traversal()
-    all_passed &= test_oem_links_surfacing()
-    all_passed &= test_action_invocation()
-    all_passed &= test_patch_update()
-    all_passed &= test_create_delete()
-    print("\nAll common Redfish usage tests passed!" if all_passed else "Some tests failed.")
@@ -5,7 +5,9 @@ Verifies that ETags are properly extracted from resources and included
 in PATCH requests via the If-Match header.
 """
 
-from rackfish import RedfishResource
+import pytest
+
+from rackfish import RedfishError, RedfishResource
 
 
 class MockClientWithETag:
@@ -26,7 +28,7 @@ class MockClientWithETag:
         self.last_patch_etag = None
         self.last_patch_data = None
 
-    def get(self, path):
+    def get(self, path, **_kwargs):
         return self._data.get(path, {})
 
     def post(self, path, data=None):
@@ -42,44 +44,49 @@ class MockClientWithETag:
         return {"result": "deleted", "path": path}
 
 
-def test_etag_in_patch_via_attribute():
+def _fetched(client, path):
+    """Wrap the mock payload at path as an already-fetched resource."""
+    return RedfishResource(client, path=path, data=client.get(path), fetched=True)
+
+
+@pytest.fixture
+def etag_env():
+    """A mock client and its ETag-carrying /redfish/v1/Systems/1 resource."""
+    client = MockClientWithETag()
+    system = _fetched(client, "/redfish/v1/Systems/1")
+    return client, system
+
+
+def test_etag_in_patch_via_attribute(etag_env):
     """Test that ETag is included when using attribute assignment."""
     print("Test: ETag included in PATCH via attribute assignment")
-    client = MockClientWithETag()
-    system = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
-    )
+    client, system = etag_env
 
     # Modify an attribute (triggers PATCH)
     system.AssetTag = "NewAssetTag"
 
-    # Verify the ETag was passed to the PATCH request
-    assert (
-        client.last_patch_etag == 'W/"12345678"'
-    ), f'Expected ETag W/"12345678", got {client.last_patch_etag}'
-    assert client.last_patch_data == {"AssetTag": "NewAssetTag"}
+    # Verify the ETag was passed to the PATCH request along with the change
+    assert (client.last_patch_etag, client.last_patch_data) == (
+        'W/"12345678"',
+        {"AssetTag": "NewAssetTag"},
+    )
     print(f"  ✓ ETag correctly passed: {client.last_patch_etag}")
-    return True
 
 
-def test_etag_in_patch_method():
+def test_etag_in_patch_method(etag_env):
     """Test that ETag is included when using .patch() method."""
     print("Test: ETag included in PATCH via .patch() method")
-    client = MockClientWithETag()
-    system = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
-    )
+    client, system = etag_env
 
     # Use patch method
     system.patch({"AssetTag": "AnotherTag", "PowerState": "Off"})
 
-    # Verify the ETag was passed to the PATCH request
-    assert (
-        client.last_patch_etag == 'W/"12345678"'
-    ), f'Expected ETag W/"12345678", got {client.last_patch_etag}'
-    assert client.last_patch_data == {"AssetTag": "AnotherTag", "PowerState": "Off"}
+    # Verify the ETag was passed to the PATCH request along with the changes
+    assert (client.last_patch_etag, client.last_patch_data) == (
+        'W/"12345678"',
+        {"AssetTag": "AnotherTag", "PowerState": "Off"},
+    )
     print(f"  ✓ ETag correctly passed: {client.last_patch_etag}")
-    return True
 
 
 def test_patch_without_etag():
@@ -92,28 +99,47 @@ def test_patch_without_etag():
         "Id": "1",
         "AssetTag": "NoETagResource",
     }
-    system = RedfishResource(
-        client, path="/redfish/v1/Systems/1", data=client.get("/redfish/v1/Systems/1"), fetched=True
-    )
+    system = _fetched(client, "/redfish/v1/Systems/1")
 
     # Modify an attribute (triggers PATCH)
     system.AssetTag = "UpdatedTag"
 
     # Verify that None was passed as ETag (no error should occur)
-    assert client.last_patch_etag is None, f"Expected None, got {client.last_patch_etag}"
-    assert client.last_patch_data == {"AssetTag": "UpdatedTag"}
+    assert (client.last_patch_etag, client.last_patch_data) == (None, {"AssetTag": "UpdatedTag"})
     print(f"  ✓ PATCH succeeded without ETag")
-    return True
-
 
-if __name__ == "__main__":
-    all_passed = True
-    all_passed &= test_etag_in_patch_via_attribute()
-    all_passed &= test_etag_in_patch_method()
-    all_passed &= test_patch_without_etag()
 
-    if all_passed:
-        print("\n✅ All ETag tests passed!")
-    else:
-        print("\n❌ Some tests failed")
-        exit(1)
+def test_batched_patch_in_with_block(etag_env):
+    """Test that assignments inside `with resource:` are sent as one PATCH."""
+    print("Test: Batched PATCH via with-block")
+    client, system = etag_env
+    patches = []
+    client.patch = lambda _path, data=None, etag=None: patches.append((data, etag))
+
+    with system:
+        system.AssetTag = "Batched"
+        system.PowerState = "Off"
+        assert patches == [], "PATCH sent before the block exited"
+
+    assert patches == [({"AssetTag": "Batched", "PowerState": "Off"}, 'W/"12345678"')]
+    assert system.AssetTag == "Batched"
+
+    # A failing block sends nothing and restores the previous value
+    def abort():
+        system.AssetTag = "Discarded"
+        raise ValueError("abort")
+
+    with pytest.raises(ValueError, match="abort"), system:
+        abort()
+    assert len(patches) == 1
+    assert system.AssetTag == "Batched"
+
+    # A rejected PATCH (e.g. 412 on a stale ETag) also restores the values
+    def reject(*_args, **_kwargs):
+        raise RedfishError("PATCH -> 412 Precondition Failed", status_code=412)
+
+    client.patch = reject
+    with pytest.raises(RedfishError, match="412"), system:
+        system.AssetTag = "Rejected"
+    assert system.AssetTag == system["AssetTag"] == "Batched"
+    print("  ✓ One PATCH per block, none on error")
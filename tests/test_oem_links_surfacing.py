@@ -4,8 +4,9 @@ Test that OEM and Links child objects are surfaced to the main object.
 """
 
 import sys
+import weakref
 
-sys.path.insert(0, ".")
+import pytest
 
 from rackfish import RedfishClient, RedfishResource
 
@@ -66,7 +67,6 @@ def test_oem_surfacing():
     assert hasattr(resource, "Oem"), "Original Oem property should still exist"
 
     print("✓ OEM surfacing test passed!\n")
-    return True
 
 
 def test_links_surfacing():
@@ -112,7 +112,45 @@ def test_links_surfacing():
     assert hasattr(resource, "Links"), "Original Links property should still exist"
 
     print("✓ Links surfacing test passed!\n")
-    return True
+
+
+def test_links_members_are_lazy():
+    """Test that surfaced Links members are not fetched until a property is read."""
+    print("Testing lazy Links members...")
+
+    class CountingClient(MockClient):
+        def __init__(self):
+            super().__init__()
+            self.fetched = []
+
+        def get(self, path):
+            self.fetched.append(path)
+            return super().get(path)
+
+    data = {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Id": "System1",
+        "Links": {
+            "Chassis": [
+                {"@odata.id": "/redfish/v1/Chassis/1U"},
+                {"@odata.id": "/redfish/v1/Chassis/Blade%201"},
+            ],
+        },
+    }
+
+    mock_client = CountingClient()
+    resource = RedfishResource(mock_client, path="/redfish/v1/Systems/1", data=data, fetched=True)
+
+    # Member ids and @odata.id come from the link itself, no GET issued
+    assert [chassis.member_id for chassis in resource.Chassis] == ["1U", "Blade 1"]
+    assert resource.Chassis[0]["@odata.id"] == "/redfish/v1/Chassis/1U"
+    assert mock_client.fetched == []
+
+    # Any other property still triggers the lazy fetch
+    assert resource.Chassis[0].Name == "Mock"
+    assert mock_client.fetched == ["/redfish/v1/Chassis/1U"]
+
+    print("✓ Lazy Links members test passed!\n")
 
 
 def test_no_collision():
@@ -145,7 +183,6 @@ def test_no_collision():
     assert resource.CustomProp == "ShouldBeSurfaced", "Non-colliding OEM property not surfaced"
 
     print("✓ Collision avoidance test passed!\n")
-    return True
 
 
 def test_oem_actions():
@@ -185,26 +222,151 @@ def test_oem_actions():
     assert callable(resource.FruControl), "FruControl should be callable"
 
     print("✓ OEM actions binding test passed!\n")
-    return True
+
+
+def test_action_binding_identity():
+    """Test that bound actions are reused while held and don't keep the resource alive."""
+    print("Testing action binding identity...")
+
+    data = {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Actions": {
+            "#ComputerSystem.Reset": {
+                "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset"
+            }
+        },
+    }
+
+    resource = RedfishResource(MockClient(), path="/redfish/v1/Systems/1", data=data, fetched=True)
+    reset = resource.Reset
+    assert resource.Reset is reset, "held bound action should be returned again"
+    assert reset.__self__ is resource
+
+    # Once the weak cache lets go, a rebound action still compares equal
+    del resource._bound_actions["Reset"]
+    rebound = resource.Reset
+    assert rebound is not reset
+    assert rebound == reset
+    assert hash(rebound) == hash(reset)
+    del rebound
+
+    # No resource -> bound method -> resource cycle: plain refcounting frees it
+    ref = weakref.ref(resource)
+    del resource, reset
+    assert ref() is None, "resource should be freed without the cycle collector"
+
+    print("✓ Action binding identity test passed!\n")
+
+
+def test_action_table_shared():
+    """Test that members with the same Actions shape share one table but keep their targets."""
+    print("Testing shared action tables...")
+
+    posted = []
+
+    class PostingClient(MockClient):
+        def post(self, path, **_kwargs):
+            posted.append(path)
+
+    def system(n):
+        target = f"/redfish/v1/Systems/{n}/Actions/ComputerSystem.Reset"
+        data = {"Actions": {"#ComputerSystem.Reset": {"target": target}}}
+        return RedfishResource(PostingClient(), path=f"/redfish/v1/Systems/{n}", data=data)
+
+    first, second, third = system(1), system(2), system(3)
+    assert first._actions is second._actions is third._actions
+    # Hydration allocates nothing per action; binding happens on first access
+    assert first._bound_actions is None
+    assert second._bound_actions is None
+    assert first.Reset.__self__ is first
+    assert second.Reset.__self__ is second
+
+    first.Reset()
+    third.Reset()
+    assert posted == [
+        "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset",
+        "/redfish/v1/Systems/3/Actions/ComputerSystem.Reset",
+    ]
+
+    print("✓ Shared action table test passed!\n")
+
+
+def test_structural_properties_built_on_access():
+    """Test that Oem/Links/Actions attributes are only converted when accessed."""
+    print("Testing deferred structural properties...")
+
+    data = {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Oem": {"Huawei": {"BootMode": "UEFI"}},
+        "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}]},
+    }
+    system = RedfishResource(MockClient(), path="/redfish/v1/Systems/1", data=data)
+
+    assert "Oem" not in system.__dict__
+    assert "Links" not in system.__dict__
+    assert system.BootMode == "UEFI"
+    assert system.Oem.Huawei.BootMode == "UEFI"
+    assert system.Oem is system.Oem
+    assert "Links" in dir(system)
+
+    print("✓ Deferred structural properties test passed!\n")
+
+
+def test_capability_membership():
+    """Test that `name in resource` covers properties, surfaced children and actions."""
+    print("Testing capability membership...")
+
+    data = {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Id": "System1",
+        "PowerState": "On",
+        "Oem": {"Huawei": {"BootMode": "UEFI"}},
+        "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}]},
+        "Actions": {
+            "#ComputerSystem.Reset": {
+                "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset"
+            }
+        },
+    }
+
+    resource = RedfishResource(MockClient(), path="/redfish/v1/Systems/1", data=data, fetched=True)
+
+    for name in ("PowerState", "BootMode", "Chassis", "Reset", "Oem", "Links"):
+        assert name in resource, f"{name} should be available"
+        assert hasattr(resource, name), f"hasattr({name}) should agree with `in`"
+    assert "FruControl" not in resource
+    assert not hasattr(resource, "FruControl")
+
+    print("✓ Capability membership test passed!\n")
+
+
+def test_dir_listing():
+    """Test that dir() lists surfaced names and is rebuilt only when attributes change."""
+    print("Testing dir() listing...")
+
+    data = {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Id": "System1",
+        "Oem": {"Huawei": {"BootMode": "UEFI"}},
+        "Actions": {
+            "#ComputerSystem.Reset": {
+                "target": "/redfish/v1/Systems/1/Actions/ComputerSystem.Reset"
+            }
+        },
+    }
+
+    resource = RedfishResource(MockClient(), path="/redfish/v1/Systems/1", data=data, fetched=True)
+
+    listing = dir(resource)
+    for name in ("Id", "BootMode", "Reset"):
+        assert name in listing, f"{name} missing from dir()"
+    assert resource.__dir__() is resource.__dir__(), "dir() listing should be cached"
+
+    resource.Note = "local"
+    assert "Note" in dir(resource), "new attributes must show up in dir()"
+
+    print("✓ dir() listing test passed!\n")
 
 
 if __name__ == "__main__":
-    try:
-        success = True
-        success &= test_oem_surfacing()
-        success &= test_links_surfacing()
-        success &= test_no_collision()
-        success &= test_oem_actions()
-
-        if success:
-            print("✅ All OEM and Links surfacing tests passed!")
-            sys.exit(0)
-        else:
-            print("❌ Some tests failed")
-            sys.exit(1)
-    except Exception as e:
-        print(f"❌ Test error: {type(e).__name__}: {e}")
-        import traceback
-
-        traceback.print_exc()
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-x"]))
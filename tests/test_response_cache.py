@@ -0,0 +1,346 @@
+"""
+Test the ETag-validated GET response cache in RedfishClient.
+
+A fake requests session stands in for the BMC so the tests can count
+round-trips and check the conditional-request headers.
+"""
+
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from rackfish import RedfishClient, RedfishResource
+
+
+def _response(status, body=None, etag=None, stream=False):
+    resp = requests.Response()
+    resp.status_code = status
+    content = json.dumps(body).encode() if body is not None else b""
+    if stream:
+        resp.raw = io.BytesIO(content)
+    else:
+        resp._content = content
+    if etag:
+        resp.headers["ETag"] = etag
+    return resp
+
+
+class FakeSession:
+    """Serves canned resources and honours If-None-Match like a BMC would."""
+
+    def __init__(self, resources):
+        self.resources = resources  # path -> (etag, body)
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False, **_kwargs):
+        path = url.replace("https://bmc", "")
+        self.requests.append(("GET", path, dict(headers or {})))
+        etag, body = self.resources[path]
+        if etag and (headers or {}).get("If-None-Match") == etag:
+            return _response(304)
+        return _response(200, body, etag, stream=stream)
+
+    def patch(self, url, **_kwargs):
+        self.requests.append(("PATCH", url.replace("https://bmc", ""), {}))
+        return _response(204)
+
+    def post(self, url, **_kwargs):
+        self.requests.append(("POST", url.replace("https://bmc", ""), {}))
+        return _response(204)
+
+    def delete(self, url, **_kwargs):
+        self.requests.append(("DELETE", url.replace("https://bmc", ""), {}))
+        return _response(204)
+
+    def close(self):
+        pass
+
+
+def _client(resources, **kwargs):
+    # TTL off by default so each GET reaches the fake session and can be inspected
+    kwargs.setdefault("cache_ttl", 0)
+    client = RedfishClient("https://bmc", use_session=False, **kwargs)
+    client._http = FakeSession(resources)
+    return client
+
+
+def test_conditional_get_returns_cached_body():
+    """Test that a repeated GET revalidates with If-None-Match and reuses the body."""
+    body = {"@odata.id": "/redfish/v1/Systems/1", "PowerState": "On"}
+    client = _client({"/redfish/v1/Systems/1": ('W/"1"', body)})
+
+    first = client.get("/redfish/v1/Systems/1")
+    second = client.get("/redfish/v1/Systems/1")
+
+    assert first == body
+    assert second == first
+    assert second is not first
+    sent = client._http.requests
+    assert sent[0][2] == {}
+    assert sent[1][2] == {"If-None-Match": 'W/"1"'}
+
+
+def test_responses_without_etag_are_not_cached():
+    """Test that resources without an ETag are always fetched in full."""
+    client = _client({"/redfish/v1": (None, {"Name": "Root"})})
+
+    client.get("/redfish/v1")
+    client.get("/redfish/v1")
+
+    assert [req[2] for req in client._http.requests] == [{}, {}]
+    assert not client._cache
+
+
+def test_body_odata_etag_used_without_header():
+    """Test that @odata.etag in the body is used when the ETag header is missing."""
+    body = {"@odata.id": "/redfish/v1/Systems/1", "@odata.etag": 'W/"7"'}
+    client = _client({"/redfish/v1/Systems/1": (None, body)})
+
+    client.get("/redfish/v1/Systems/1")
+    client.get("/redfish/v1/Systems/1")
+
+    assert client._http.requests[1][2] == {"If-None-Match": 'W/"7"'}
+
+
+def test_writes_invalidate_resource_and_parents():
+    """Test that PATCH/POST/DELETE drop the target and its parent collection."""
+    client = _client(
+        {
+            "/redfish/v1/Systems": ('W/"c"', {"Members": []}),
+            "/redfish/v1/Systems/1": ('W/"1"', {"PowerState": "On"}),
+            "/redfish/v1/Managers/1": ('W/"m"', {"Id": "1"}),
+        }
+    )
+    client.get("/redfish/v1/Systems")
+    client.get("/redfish/v1/Systems/1")
+    client.get("/redfish/v1/Managers/1")
+
+    client.post("/redfish/v1/Systems/1/Actions/ComputerSystem.Reset", {"ResetType": "On"})
+
+    assert list(client._cache) == ["https://bmc/redfish/v1/Managers/1"]
+
+
+def test_writes_invalidate_query_variants():
+    """Test that a write drops cached $filter/$expand pages of the parent collection."""
+    subs = "/redfish/v1/EventService/Subscriptions"
+    sub = subs + "/1"
+    filtered = subs + "?$filter=Context%20eq%20'a'"
+    expanded = subs + "?$expand=.($levels=1)"
+    resources = {
+        subs: (None, {"Members": [{"@odata.id": sub}]}),
+        sub: (None, {"@odata.id": sub, "Id": "1", "Context": "a"}),
+        filtered: (None, {"Members": [{"@odata.id": sub}]}),
+        expanded: (None, {"Members": [{"@odata.id": sub, "Id": "1", "Context": "a"}]}),
+    }
+    client = _client(resources, cache_ttl=60)
+    assert [m.Id for m in RedfishResource(client, path=subs).filter(Context="a")] == ["1"]
+    assert [m.Id for m in RedfishResource(client, path=subs).expand()] == ["1"]
+
+    client.delete(sub)
+    del resources[sub]
+    resources[filtered] = resources[expanded] = (None, {"Members": []})
+
+    assert list(RedfishResource(client, path=subs).filter(Context="a")) == []
+    assert list(RedfishResource(client, path=subs).expand()) == []
+
+
+def test_fresh_entries_skip_the_request():
+    """Test that GETs within cache_ttl are answered without contacting the BMC."""
+    client = _client({"/redfish/v1": (None, {"Name": "Root"})}, cache_ttl=60)
+
+    first = client.get("/redfish/v1")
+    second = client.get("/redfish/v1")
+
+    assert second == first
+    assert second is not first
+    assert len(client._http.requests) == 1
+
+
+def test_use_cache_false_bypasses_ttl():
+    """Test that use_cache=False goes to the BMC and still revalidates by ETag."""
+    client = _client({"/redfish/v1/Systems/1": ('W/"1"', {"Id": "1"})}, cache_ttl=60)
+
+    client.get("/redfish/v1/Systems/1")
+    client.get("/redfish/v1/Systems/1", use_cache=False)
+
+    assert [req[2] for req in client._http.requests] == [{}, {"If-None-Match": 'W/"1"'}]
+
+
+def test_cache_is_bounded_lru():
+    """Test that the least recently used entry is evicted first."""
+    client = _client(
+        {f"/redfish/v1/Systems/{i}": (f'W/"{i}"', {"Id": str(i)}) for i in range(3)},
+        cache_size=2,
+    )
+    client.get("/redfish/v1/Systems/0")
+    client.get("/redfish/v1/Systems/1")
+    client.get("/redfish/v1/Systems/0")  # refresh recency of 0
+    client.get("/redfish/v1/Systems/2")
+
+    assert list(client._cache) == [
+        "https://bmc/redfish/v1/Systems/0",
+        "https://bmc/redfish/v1/Systems/2",
+    ]
+
+
+def test_cache_can_be_disabled():
+    """Test that cache_size=0 turns the cache off."""
+    client = _client({"/redfish/v1/Systems/1": ('W/"1"', {"Id": "1"})}, cache_size=0)
+
+    client.get("/redfish/v1/Systems/1")
+    client.get("/redfish/v1/Systems/1")
+
+    assert [req[2] for req in client._http.requests] == [{}, {}]
+
+
+def test_disk_cache_survives_new_client(tmp_path):
+    """Test that cache_dir lets a fresh client revalidate instead of refetching."""
+    resources = {"/redfish/v1/Systems/1": ('W/"1"', {"PowerState": "On"})}
+    _client(resources, cache_dir=tmp_path).get("/redfish/v1/Systems/1")
+
+    client = _client(resources, cache_dir=tmp_path)
+    body = client.get("/redfish/v1/Systems/1")
+
+    assert body == {"PowerState": "On"}
+    assert client._http.requests[0][2] == {"If-None-Match": 'W/"1"'}
+
+    client.patch("/redfish/v1/Systems/1", {"PowerState": "Off"})
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_disk_cache_is_private(tmp_path):
+    """Test that the cache directory and files are readable by the owner only."""
+    cache_dir = tmp_path / "cache"
+    resources = {"/redfish/v1/Systems/1": ('W/"1"', {"PowerState": "On"})}
+    _client(resources, cache_dir=cache_dir).get("/redfish/v1/Systems/1")
+
+    assert cache_dir.stat().st_mode & 0o077 == 0
+    files = list(cache_dir.iterdir())
+    assert len(files) == 1
+    assert files[0].stat().st_mode & 0o077 == 0
+
+
+def test_service_root_suffix_is_stripped():
+    """Test that a base_url given with /redfish/v1 resolves paths like a bare host."""
+    client = RedfishClient("https://bmc/redfish/v1/", use_session=False)
+
+    assert client.base_url == "https://bmc"
+    assert client._root_url == "https://bmc/redfish/v1"
+    assert client._absurl("/redfish/v1/Systems/1") == "https://bmc/redfish/v1/Systems/1"
+
+
+def test_iter_members_streams_pages():
+    """Test that iter_members parses members incrementally and follows nextLink."""
+    pytest.importorskip("ijson")
+    entries = "/redfish/v1/Systems/1/LogServices/Sel/Entries"
+    client = _client(
+        {
+            entries: (
+                None,
+                {
+                    "Members": [{"Id": "1", "Severity": "OK"}, {"Id": "2", "Temp": 41.5}],
+                    "Members@odata.nextLink": entries + "?$skip=2",
+                },
+            ),
+            entries + "?$skip=2": (None, {"Members": [{"Id": "3", "Links": {"X": []}}]}),
+        }
+    )
+
+    members = list(client.iter_members(entries))
+
+    assert members == [
+        {"Id": "1", "Severity": "OK"},
+        {"Id": "2", "Temp": 41.5},
+        {"Id": "3", "Links": {"X": []}},
+    ]
+    assert not client._cache
+
+
+def test_unverified_clients_share_ssl_context():
+    """Test that verify_ssl=False clients reuse one SSLContext across pools."""
+    first = RedfishClient("https://bmc-a", use_session=False, verify_ssl=False)
+    second = RedfishClient("https://bmc-b", use_session=False, verify_ssl=False)
+
+    contexts = [
+        client._http.get_adapter(client.base_url).poolmanager.connection_pool_kw["ssl_context"]
+        for client in (first, second)
+    ]
+    assert contexts[0] is contexts[1]
+    assert not contexts[0].check_hostname
+
+
+def test_action_info_shared_across_resources():
+    """Test that members sharing an ActionInfo URI fetch and compile it once."""
+    info = "/redfish/v1/Systems/ResetActionInfo"
+    client = _client(
+        {info: (None, {"Parameters": [{"Name": "ResetType", "AllowableValues": ["On"]}]})}
+    )
+    actions = {"#ComputerSystem.Reset": {"target": "/Reset", "@Redfish.ActionInfo": info}}
+    for n in (1, 2):
+        system = RedfishResource(client, path=f"/redfish/v1/Systems/{n}", data={"Actions": actions})
+        system.Reset(ResetType="On")
+
+    assert [req[:2] for req in client._http.requests] == [
+        ("GET", info),
+        ("POST", "/Reset"),
+        ("POST", "/Reset"),
+    ]
+
+
+def test_refresh_unchanged_resource_keeps_children():
+    """Test that refresh() answered by a 304 leaves the hydrated resource as is."""
+    path = "/redfish/v1/Systems/1"
+    client = _client({path: ('W/"1"', {"Id": "1", "Status": {"Health": "OK"}})})
+    system = RedfishResource(client, path=path)
+    status = system.Status
+
+    system.refresh()
+
+    assert system.Status is status
+    assert client._http.requests[-1][2] == {"If-None-Match": 'W/"1"'}
+
+
+def test_mutating_one_resource_leaves_siblings_and_cache_intact():
+    """Test that resources built from one cached path do not share their body."""
+    path = "/redfish/v1/Systems/1"
+    client = _client({path: ('W/"1"', {"Id": "1", "AssetTag": "A"})}, cache_ttl=60)
+    first = RedfishResource(client, path=path)
+    second = RedfishResource(client, path=path)
+    first._ensure_fetched()
+    second._ensure_fetched()
+
+    first.AssetTag = "X"
+
+    assert second.AssetTag == "A"
+    assert second["AssetTag"] == "A"
+    assert second.to_dict()["AssetTag"] == "A"
+    assert client.get(path)["AssetTag"] == "A"
+
+
+def test_concurrent_first_use_connects_once():
+    """Test that threads racing on client.root share one service root fetch."""
+    client = _client({"/redfish/v1": (None, {"Name": "Root"})})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        roots = list(pool.map(lambda _: client.root, range(16)))
+
+    assert all(root is roots[0] for root in roots)
+    assert len(client._http.requests) == 1
+
+
+def test_refresh_changed_resource_rehydrates():
+    """Test that refresh() picks up a changed body and drops vanished properties."""
+    path = "/redfish/v1/Systems/1"
+    client = _client({path: ('W/"1"', {"Id": "1", "AssetTag": "old"})})
+    system = RedfishResource(client, path=path)
+    assert system.AssetTag == "old"
+
+    client._http.resources[path] = ('W/"2"', {"Id": "1", "PowerState": "On"})
+    system.refresh()
+
+    assert system.PowerState == "On"
+    assert not hasattr(system, "AssetTag")
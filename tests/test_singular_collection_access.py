@@ -5,78 +5,88 @@ When a collection has only one member, it should be accessible via singular name
 E.g., client.System instead of client.Systems when only one system exists.
 """
 
+from types import MappingProxyType
+
 import pytest
 
 from rackfish import RedfishClient, RedfishResource
 
+_MOCK_DATA = {
+    "/redfish/v1": {
+        "Systems": {"@odata.id": "/redfish/v1/Systems"},
+        "Chassis": {"@odata.id": "/redfish/v1/Chassis"},
+        "Managers": {"@odata.id": "/redfish/v1/Managers"},
+    },
+    "/redfish/v1/Systems": {
+        "@odata.id": "/redfish/v1/Systems",
+        "Members": [
+            {"@odata.id": "/redfish/v1/Systems/1"},
+        ],
+        "Members@odata.count": 1,
+    },
+    "/redfish/v1/Systems/1": {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Id": "1",
+        "Name": "System 1",
+        "PowerState": "On",
+        "Processors": {"@odata.id": "/redfish/v1/Systems/1/Processors"},
+    },
+    "/redfish/v1/Chassis": {
+        "@odata.id": "/redfish/v1/Chassis",
+        "Members": [
+            {"@odata.id": "/redfish/v1/Chassis/1"},
+            {"@odata.id": "/redfish/v1/Chassis/2"},
+        ],
+        "Members@odata.count": 2,
+    },
+    "/redfish/v1/Chassis/1": {
+        "@odata.id": "/redfish/v1/Chassis/1",
+        "Id": "1",
+        "Name": "Chassis 1",
+    },
+    "/redfish/v1/Chassis/2": {
+        "@odata.id": "/redfish/v1/Chassis/2",
+        "Id": "2",
+        "Name": "Chassis 2",
+    },
+    "/redfish/v1/Managers": {
+        "@odata.id": "/redfish/v1/Managers",
+        "Members": [],
+        "Members@odata.count": 0,
+    },
+    "/redfish/v1/Systems/1/Processors": {
+        "@odata.id": "/redfish/v1/Systems/1/Processors",
+        "Members": [
+            {"@odata.id": "/redfish/v1/Systems/1/Processors/CPU1"},
+        ],
+        "Members@odata.count": 1,
+    },
+    "/redfish/v1/Systems/1/Processors/CPU1": {
+        "@odata.id": "/redfish/v1/Systems/1/Processors/CPU1",
+        "Id": "CPU1",
+        "Name": "Processor 1",
+        "TotalCores": 8,
+    },
+}
+
+# Shared like _MOCK_DATA: the tests only read what get() returns
+_NOT_FOUND: dict = {}
+
 
 class MockClient:
     """Mock client that returns mock data for testing."""
 
+    __slots__ = ("_data", "_lookup", "_session_token", "base_url")
+
     def __init__(self):
         self.base_url = "https://mock"
         self._session_token = None
-        self._data = {
-            "/redfish/v1": {
-                "Systems": {"@odata.id": "/redfish/v1/Systems"},
-                "Chassis": {"@odata.id": "/redfish/v1/Chassis"},
-                "Managers": {"@odata.id": "/redfish/v1/Managers"},
-            },
-            "/redfish/v1/Systems": {
-                "@odata.id": "/redfish/v1/Systems",
-                "Members": [
-                    {"@odata.id": "/redfish/v1/Systems/1"},
-                ],
-                "Members@odata.count": 1,
-            },
-            "/redfish/v1/Systems/1": {
-                "@odata.id": "/redfish/v1/Systems/1",
-                "Id": "1",
-                "Name": "System 1",
-                "PowerState": "On",
-                "Processors": {"@odata.id": "/redfish/v1/Systems/1/Processors"},
-            },
-            "/redfish/v1/Chassis": {
-                "@odata.id": "/redfish/v1/Chassis",
-                "Members": [
-                    {"@odata.id": "/redfish/v1/Chassis/1"},
-                    {"@odata.id": "/redfish/v1/Chassis/2"},
-                ],
-                "Members@odata.count": 2,
-            },
-            "/redfish/v1/Chassis/1": {
-                "@odata.id": "/redfish/v1/Chassis/1",
-                "Id": "1",
-                "Name": "Chassis 1",
-            },
-            "/redfish/v1/Chassis/2": {
-                "@odata.id": "/redfish/v1/Chassis/2",
-                "Id": "2",
-                "Name": "Chassis 2",
-            },
-            "/redfish/v1/Managers": {
-                "@odata.id": "/redfish/v1/Managers",
-                "Members": [],
-                "Members@odata.count": 0,
-            },
-            "/redfish/v1/Systems/1/Processors": {
-                "@odata.id": "/redfish/v1/Systems/1/Processors",
-                "Members": [
-                    {"@odata.id": "/redfish/v1/Systems/1/Processors/CPU1"},
-                ],
-                "Members@odata.count": 1,
-            },
-            "/redfish/v1/Systems/1/Processors/CPU1": {
-                "@odata.id": "/redfish/v1/Systems/1/Processors/CPU1",
-                "Id": "CPU1",
-                "Name": "Processor 1",
-                "TotalCores": 8,
-            },
-        }
+        self._data = MappingProxyType(_MOCK_DATA)
+        self._lookup = self._data.get
 
     def get(self, path: str, **_kwargs):
         """Return mock responses for different paths."""
-        return self._data.get(path, {})
+        return self._lookup(path, _NOT_FOUND)
 
     def post(self, _path, _data, **_kwargs):
         return {}
@@ -99,6 +109,17 @@ def test_singular_access_to_single_member_collection():
     assert system.Name == "System 1"
     assert system.PowerState == "On"
 
+    # Repeated singular access resolves the same collection again
+    assert root.System.Id == "1"
+
+
+def test_singular_member_of_one_member_collection():
+    """Test that collection.Member returns the only member of the collection."""
+    mock_client = MockClient()
+    systems = RedfishResource(mock_client, path="/redfish/v1/Systems")
+
+    assert systems.Member.Id == "1"
+
 
 def test_singular_access_fails_for_multiple_members():
     """Test that singular access raises AttributeError when collection has multiple members."""
@@ -133,6 +154,18 @@ def test_singular_access_via_client():
     assert system.Name == "System 1"
 
 
+def test_client_root_attributes_are_cached():
+    """Test that repeated client-level access reuses the resolved resource."""
+    mock_client = MockClient()
+    client = RedfishClient.__new__(RedfishClient)
+    client._root = RedfishResource(mock_client, path="/redfish/v1", data=None, fetched=False)
+
+    systems = client.Systems
+    assert client.Systems is systems
+    assert client.System is client.System
+    assert set(client._root_attr_cache) == {"Systems", "System"}
+
+
 def test_singular_access_nested_collections():
     """Test singular access works for nested collections."""
     mock_client = MockClient()